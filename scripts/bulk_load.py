@@ -0,0 +1,102 @@
+"""
+Bulk loader for Farmer Credit Score Engine
+Loads generated farmer profiles into the database in a single transaction.
+
+Uses the API's models and DB settings; run with services/api on PYTHONPATH:
+    PYTHONPATH=services/api python scripts/bulk_load.py sample_data/farmers.parquet
+"""
+import argparse
+import io
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import insert
+
+from database import engine, init_db
+from models import Farmer
+
+# Farmer table columns populated from the generated dataset
+FARMER_COLUMNS = [
+    'farmer_id', 'name', 'mobile', 'aadhar', 'state', 'district', 'village',
+    'latitude', 'longitude', 'land_area', 'crop_type', 'consent_given',
+    'consent_date', 'created_at'
+]
+
+def load_farmers(data_path: str) -> pd.DataFrame:
+    """
+    Read generated farmer profiles and shape them to the farmers table
+    
+    Args:
+        data_path: Path to farmers.parquet or farmers.csv
+    
+    Returns:
+        DataFrame with exactly FARMER_COLUMNS
+    """
+    if data_path.endswith('.parquet'):
+        df = pd.read_parquet(data_path)
+    else:
+        # Keep identifiers as text; '+91...' would otherwise parse as integers
+        df = pd.read_csv(data_path, dtype={'mobile': str, 'aadhar': str})
+    
+    df['consent_given'] = df['consent_given'].astype(bool)
+    df['created_at'] = pd.to_datetime(df['created_at'])
+    df['consent_date'] = pd.Series(datetime.utcnow(), index=df.index).where(df['consent_given'])
+    
+    return df[FARMER_COLUMNS]
+
+def insert_farmers(df: pd.DataFrame) -> None:
+    """Insert all rows with one batched executemany"""
+    records = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+    with engine.begin() as conn:
+        conn.execute(insert(Farmer), records)
+
+def copy_farmers(df: pd.DataFrame) -> None:
+    """Stream all rows through PostgreSQL COPY FROM STDIN"""
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+    
+    raw_connection = engine.raw_connection()
+    try:
+        with raw_connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY farmers ({', '.join(FARMER_COLUMNS)}) FROM STDIN WITH CSV",
+                buffer
+            )
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Bulk load generated farmers into the database")
+    parser.add_argument(
+        'data_path',
+        nargs='?',
+        default='sample_data/farmers.parquet',
+        help="Generated farmers file (default: sample_data/farmers.parquet)"
+    )
+    parser.add_argument(
+        '--method',
+        choices=['copy', 'insert'],
+        default='copy',
+        help="COPY FROM STDIN (PostgreSQL) or batched INSERT (default: copy)"
+    )
+    return parser.parse_args()
+
+def main():
+    """Load farmers in one transaction"""
+    args = parse_args()
+    
+    init_db()
+    df = load_farmers(args.data_path)
+    
+    if args.method == 'copy':
+        copy_farmers(df)
+    else:
+        insert_farmers(df)
+    
+    print(f"✓ Loaded {len(df)} farmers from {args.data_path} via {args.method}")
+
+if __name__ == '__main__':
+    main()
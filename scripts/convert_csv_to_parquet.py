@@ -0,0 +1,60 @@
+"""
+CSV to Parquet converter for Farmer Credit Score Engine
+Rewrites CSV datasets (e.g. from --format csv) as Parquet with categorical columns.
+"""
+import argparse
+import os
+
+import pandas as pd
+
+# Low-cardinality string columns stored as categoricals per dataset
+CATEGORICAL_COLUMNS = {
+    'farmers': ['crop_type', 'state', 'district', 'village'],
+    'satellite': ['land_id', 'farmer_id'],
+    'weather': ['geo_key', 'state']
+}
+
+# Identifier columns kept as text; '+91...' would otherwise parse as integers
+TEXT_COLUMNS = {'mobile': str, 'aadhar': str}
+
+def convert_dataset(data_dir: str, name: str) -> int:
+    """
+    Convert one dataset's CSV to Parquet alongside it
+    
+    Args:
+        data_dir: Directory holding <name>.csv
+        name: Dataset name
+    
+    Returns:
+        Number of rows written
+    """
+    csv_path = os.path.join(data_dir, f"{name}.csv")
+    df = pd.read_csv(csv_path, dtype=TEXT_COLUMNS if name == 'farmers' else None)
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS[name] if col in df})
+    df.to_parquet(os.path.join(data_dir, f"{name}.parquet"), index=False)
+    return len(df)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Convert generated CSV datasets to Parquet")
+    parser.add_argument(
+        'data_dir',
+        nargs='?',
+        default='sample_data',
+        help="Directory with farmers.csv, satellite.csv and weather.csv (default: sample_data)"
+    )
+    return parser.parse_args()
+
+def main():
+    """Convert every dataset found in the data directory"""
+    args = parse_args()
+    
+    for name in CATEGORICAL_COLUMNS:
+        if not os.path.exists(os.path.join(args.data_dir, f"{name}.csv")):
+            print(f"Skipping {name}: no {name}.csv in {args.data_dir}")
+            continue
+        rows = convert_dataset(args.data_dir, name)
+        print(f"✓ Wrote {name}.parquet ({rows} records)")
+
+if __name__ == '__main__':
+    main()
@@ -2,169 +2,364 @@
 Synthetic Data Generator for Farmer Credit Score Engine
 Generates realistic farmer profiles, satellite data, and weather data for testing.
 """
+import argparse
+from multiprocessing import Pool
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
 import json
 
-# Set random seed for reproducibility
+# Root seed for reproducibility; each farmer chunk draws from its own spawned PCG64 stream
 SEED = 42
-np.random.seed(SEED)
 
 # Constants
 NUM_FARMERS = 200
 CROP_TYPES = ['rice', 'wheat', 'cotton', 'maize']
 STATES = ['Punjab', 'Haryana', 'Uttar Pradesh', 'Maharashtra', 'Karnataka']
 
-def generate_farmers():
-    """Generate synthetic farmer profiles"""
-    farmers = []
+# Past KCC default counts: 95% clean, 4% one default, 1% two defaults
+KCC_DEFAULT_VALUES = [0, 1, 2]
+KCC_DEFAULT_PROBS = [0.95, 0.04, 0.01]
+
+# Date tables shared by every chunk: formatted once, then tiled/indexed per farmer
+NOW = datetime.now()
+NUM_SATELLITE_MONTHS = 12
+NUM_WEATHER_DAYS = 90
+SATELLITE_DATES = np.array([
+    (NOW - timedelta(days=30 * (NUM_SATELLITE_MONTHS - month))).strftime('%Y-%m-%d')
+    for month in range(NUM_SATELLITE_MONTHS)
+])
+_weather_days = [NOW - timedelta(days=NUM_WEATHER_DAYS - day) for day in range(NUM_WEATHER_DAYS)]
+WEATHER_DATES = np.array([date.strftime('%Y-%m-%d') for date in _weather_days])
+WEATHER_MONTHS = np.array([date.month for date in _weather_days])
+
+# Seasonal rainfall scale per weather day: monsoon, post-monsoon, dry season
+WEATHER_RAINFALL_SCALE = np.where(
+    np.isin(WEATHER_MONTHS, [6, 7, 8, 9]), 8.0,
+    np.where(np.isin(WEATHER_MONTHS, [10, 11]), 3.0, 0.5)
+)
+
+# Output settings
+OUTPUT_DIR = 'sample_data'
+OUTPUT_FORMATS = ['parquet', 'csv']
+DATASETS = ['farmers', 'satellite', 'weather']
+
+# Farmers generated and written per chunk; peak memory is bounded by this, not NUM_FARMERS
+CHUNK_SIZE = 10_000
+SUMMARY_COLUMNS = ['crop_type', 'state', 'land_area', 'ndvi_mean', 'past_kcc_defaults']
+
+# Low-cardinality string columns stored dictionary-encoded in Parquet
+DICTIONARY_COLUMNS = ['crop_type', 'state', 'district']
+PARQUET_COMPRESSION = 'zstd'
+PARQUET_COMPRESSION_LEVEL = 3
+
+# Stored decimal places per generated float column
+COLUMN_DECIMALS = {
+    'latitude': 6,
+    'longitude': 6,
+    'land_area': 2,
+    'last_year_yield_est': 2,
+    'ndvi_mean': 3,
+    'ndvi_trend': 3,
+    'rainfall_anomaly_3mo': 1,
+    'market_price_volatility': 1,
+    'distance_to_mandi_km': 1,
+    'ndvi': 3,
+    'cloud_cover': 1,
+    'rainfall_mm': 1,
+    'temperature_max': 1,
+    'temperature_min': 1,
+    'humidity': 1
+}
+
+def round_columns(columns):
+    """
+    Round float columns to their stored precision in place
     
-    for i in range(NUM_FARMERS):
-        farmer_id = f"FRM{str(i+1).zfill(6)}"
-        crop_type = np.random.choice(CROP_TYPES)
-        state = np.random.choice(STATES)
-        
-        # Generate realistic features
-        land_area = np.random.uniform(0.5, 10.0)  # hectares
-        last_year_yield = np.random.uniform(1.5, 5.0) * land_area  # tons
-        
-        # NDVI values (0.2 to 0.9, higher is better)
-        ndvi_mean = np.random.uniform(0.3, 0.85)
-        ndvi_trend = np.random.uniform(-0.15, 0.15)
-        
-        # Rainfall anomaly (-50 to +50 mm)
-        rainfall_anomaly_3mo = np.random.uniform(-50, 50)
-        
-        # Credit history
-        past_kcc_defaults = np.random.choice([0, 0, 0, 1, 2], p=[0.6, 0.25, 0.1, 0.04, 0.01])
-        
-        # Alternative data
-        upi_txn_freq = np.random.randint(0, 50)  # transactions per month
-        market_price_volatility = np.random.uniform(5, 30)  # percentage
-        fpo_membership = np.random.choice([0, 1], p=[0.6, 0.4])
-        distance_to_mandi = np.random.uniform(2, 50)  # km
-        
-        # Generate geo coordinates (approximate Indian agricultural regions)
-        lat = np.random.uniform(15.0, 30.0)
-        lon = np.random.uniform(72.0, 85.0)
-        
-        farmer = {
-            'farmer_id': farmer_id,
-            'name': f"Farmer {i+1}",
-            'mobile': f"+91{''.join([str(np.random.randint(0, 10)) for _ in range(10)])}",
-            'aadhar': f"{np.random.randint(1000, 9999)} {np.random.randint(1000, 9999)} {np.random.randint(1000, 9999)}",
-            'state': state,
-            'district': f"District {np.random.randint(1, 20)}",
-            'village': f"Village {np.random.randint(1, 100)}",
-            'latitude': round(lat, 6),
-            'longitude': round(lon, 6),
-            'land_area': round(land_area, 2),
-            'crop_type': crop_type,
-            'last_year_yield_est': round(last_year_yield, 2),
-            'ndvi_mean': round(ndvi_mean, 3),
-            'ndvi_trend': round(ndvi_trend, 3),
-            'rainfall_anomaly_3mo': round(rainfall_anomaly_3mo, 1),
-            'past_kcc_defaults': past_kcc_defaults,
-            'upi_txn_freq': upi_txn_freq,
-            'market_price_volatility': round(market_price_volatility, 1),
-            'fpo_membership_flag': fpo_membership,
-            'distance_to_mandi_km': round(distance_to_mandi, 1),
-            'consent_given': True,
-            'created_at': (datetime.now() - timedelta(days=np.random.randint(1, 365))).isoformat()
-        }
-        
-        farmers.append(farmer)
+    Args:
+        columns: Dict of column name -> numpy array
+    
+    Returns:
+        The same dict, for chaining
+    """
+    for name, decimals in COLUMN_DECIMALS.items():
+        if name in columns:
+            np.round(columns[name], decimals, out=columns[name])
+    return columns
+
+def generate_farmers(rng, start=0, n=NUM_FARMERS):
+    """
+    Generate synthetic farmer profiles
+    
+    Args:
+        rng: numpy Generator to draw from
+        start: Index of the first farmer (farmer IDs are numbered from start + 1)
+        n: Number of farmers to generate
+    
+    Returns:
+        Dict of column name -> 1-D numpy array (one entry per farmer)
+    """
+    numbers = (np.arange(start, start + n) + 1).astype(str)
+    farmer_ids = np.char.add('FRM', np.char.zfill(numbers, 6))
+    names = np.char.add('Farmer ', numbers)
+    crop_type = rng.choice(CROP_TYPES, n)
+    state = rng.choice(STATES, n)
+    
+    # Generate realistic features
+    land_area = rng.uniform(0.5, 10.0, n)  # hectares
+    last_year_yield = rng.uniform(1.5, 5.0, n) * land_area  # tons
+    
+    # NDVI values (0.2 to 0.9, higher is better)
+    ndvi_mean = rng.uniform(0.3, 0.85, n)
+    ndvi_trend = rng.uniform(-0.15, 0.15, n)
+    
+    # Rainfall anomaly (-50 to +50 mm)
+    rainfall_anomaly_3mo = rng.uniform(-50, 50, n)
+    
+    # Credit history
+    past_kcc_defaults = rng.choice(KCC_DEFAULT_VALUES, size=n, p=KCC_DEFAULT_PROBS)
     
-    return pd.DataFrame(farmers)
+    # Alternative data
+    upi_txn_freq = rng.integers(0, 50, n)  # transactions per month
+    market_price_volatility = rng.uniform(5, 30, n)  # percentage
+    fpo_membership = rng.choice([0, 1], size=n, p=[0.6, 0.4])
+    distance_to_mandi = rng.uniform(2, 50, n)  # km
+    
+    # Generate geo coordinates (approximate Indian agricultural regions)
+    lat = rng.uniform(15.0, 30.0, n)
+    lon = rng.uniform(72.0, 85.0, n)
+    
+    # Identity and address fields
+    mobile_digits = rng.integers(0, 10**10, n, dtype=np.int64).astype(str)
+    mobile = np.char.add('+91', np.char.zfill(mobile_digits, 10))
+    aadhar_parts = rng.integers(1000, 9999, (3, n)).astype(str)
+    aadhar = aadhar_parts[0]
+    for part in aadhar_parts[1:]:
+        aadhar = np.char.add(np.char.add(aadhar, ' '), part)
+    district = np.char.add('District ', rng.integers(1, 20, n).astype(str))
+    village = np.char.add('Village ', rng.integers(1, 100, n).astype(str))
+    created_days_ago = rng.integers(1, 365, n).astype('timedelta64[D]')
+    created_at = np.datetime_as_string(np.datetime64(NOW, 'us') - created_days_ago, unit='us')
+    
+    return round_columns({
+        'farmer_id': farmer_ids,
+        'name': names,
+        'mobile': mobile,
+        'aadhar': aadhar,
+        'state': state,
+        'district': district,
+        'village': village,
+        'latitude': lat,
+        'longitude': lon,
+        'land_area': land_area,
+        'crop_type': crop_type,
+        'last_year_yield_est': last_year_yield,
+        'ndvi_mean': ndvi_mean,
+        'ndvi_trend': ndvi_trend,
+        'rainfall_anomaly_3mo': rainfall_anomaly_3mo,
+        'past_kcc_defaults': past_kcc_defaults,
+        'upi_txn_freq': upi_txn_freq,
+        'market_price_volatility': market_price_volatility,
+        'fpo_membership_flag': fpo_membership,
+        'distance_to_mandi_km': distance_to_mandi,
+        'consent_given': np.ones(n, dtype=bool),
+        'created_at': created_at
+    })
 
-def generate_satellite_data(farmers_df):
+def generate_satellite_data(rng, farmers):
     """Generate synthetic satellite NDVI time series"""
-    satellite_data = []
+    farmer_ids = farmers['farmer_id']
+    n = len(farmer_ids)
+    num_months = NUM_SATELLITE_MONTHS
     
-    for _, farmer in farmers_df.iterrows():
-        land_id = f"LAND{farmer['farmer_id'][3:]}"
-        base_ndvi = farmer['ndvi_mean']
-        trend = farmer['ndvi_trend']
-        
-        # Generate 12 months of NDVI data
-        for month in range(12):
-            date = datetime.now() - timedelta(days=30 * (12 - month))
-            # Add seasonal variation and trend
-            seasonal_factor = 0.1 * np.sin(2 * np.pi * month / 12)
-            noise = np.random.normal(0, 0.05)
-            ndvi = base_ndvi + trend * (month / 12) + seasonal_factor + noise
-            ndvi = max(0.1, min(0.9, ndvi))  # Clamp to valid range
-            
-            satellite_data.append({
-                'land_id': land_id,
-                'farmer_id': farmer['farmer_id'],
-                'date': date.strftime('%Y-%m-%d'),
-                'ndvi': round(ndvi, 3),
-                'cloud_cover': round(np.random.uniform(0, 40), 1)
-            })
-    
-    return pd.DataFrame(satellite_data)
-
-def generate_weather_data(farmers_df):
+    land_ids = np.char.replace(farmer_ids, 'FRM', 'LAND', count=1)
+    base_ndvi = farmers['ndvi_mean'][:, None]
+    trend = farmers['ndvi_trend'][:, None]
+    
+    # Generate 12 months of NDVI data per farmer as an (n, 12) grid
+    months = np.arange(num_months)[None, :]
+    
+    # Add seasonal variation and trend
+    seasonal_factor = 0.1 * np.sin(2 * np.pi * months / num_months)
+    noise = rng.normal(0, 0.05, (n, num_months))
+    ndvi = base_ndvi + trend * (months / num_months) + seasonal_factor + noise
+    ndvi = np.clip(ndvi, 0.1, 0.9)  # Clamp to valid range
+    cloud_cover = rng.uniform(0, 40, (n, num_months))
+    
+    return round_columns({
+        'land_id': np.repeat(land_ids, num_months),
+        'farmer_id': np.repeat(farmer_ids, num_months),
+        'date': np.tile(SATELLITE_DATES, n),
+        'ndvi': ndvi.ravel(),
+        'cloud_cover': cloud_cover.ravel()
+    })
+
+def generate_weather_data(rng, farmers):
     """Generate synthetic weather data"""
-    weather_data = []
+    num_days = NUM_WEATHER_DAYS
+    
+    # Group by approximate location, keeping first-seen order
+    _, first_seen = np.unique(
+        np.rec.fromarrays([farmers['latitude'], farmers['longitude'], farmers['state']]),
+        return_index=True
+    )
+    first_seen.sort()
+    latitude = farmers['latitude'][first_seen]
+    longitude = farmers['longitude'][first_seen]
+    state = farmers['state'][first_seen]
+    num_locations = len(first_seen)
+    geo_keys = np.char.add(
+        np.char.add(np.round(latitude, 1).astype(str), '_'),
+        np.round(longitude, 1).astype(str)
+    )
+    
+    # Generate 90 days of weather data per location as an (L, 90) grid
+    rainfall = rng.exponential(WEATHER_RAINFALL_SCALE[None, :], (num_locations, num_days))
+    temperature_max = rng.uniform(28, 42, (num_locations, num_days))
+    temperature_min = rng.uniform(15, 28, (num_locations, num_days))
+    humidity = rng.uniform(40, 90, (num_locations, num_days))
+    
+    return round_columns({
+        'geo_key': np.repeat(geo_keys, num_days),
+        'latitude': np.repeat(latitude, num_days),
+        'longitude': np.repeat(longitude, num_days),
+        'state': np.repeat(state, num_days),
+        'date': np.tile(WEATHER_DATES, num_locations),
+        'rainfall_mm': rainfall.ravel(),
+        'temperature_max': temperature_max.ravel(),
+        'temperature_min': temperature_min.ravel(),
+        'humidity': humidity.ravel()
+    })
+
+def generate_chunk(chunk):
+    """
+    Generate one chunk of farmers with their satellite and weather data
     
-    # Group by approximate location
-    locations = farmers_df[['latitude', 'longitude', 'state']].drop_duplicates()
+    Args:
+        chunk: (seed_sequence, start, n) tuple; the chunk's data depends only
+            on these, so results do not change with the number of workers
     
-    for _, loc in locations.iterrows():
-        geo_key = f"{round(loc['latitude'], 1)}_{round(loc['longitude'], 1)}"
+    Returns:
+        Dict of dataset name -> dict of column arrays
+    """
+    seed_sequence, start, n = chunk
+    rng = np.random.default_rng(seed_sequence)
+    farmers = generate_farmers(rng, start, n)
+    return {
+        'farmers': farmers,
+        'satellite': generate_satellite_data(rng, farmers),
+        'weather': generate_weather_data(rng, farmers)
+    }
+
+class DatasetWriter:
+    """
+    Streams dataset chunks to a single file with Arrow's native writers
+    
+    Chunks are dicts of 1-D numpy arrays, wrapped as Arrow columns without
+    going through pandas. The file is opened on the first chunk, using that
+    chunk's schema.
+    """
+    
+    def __init__(self, name, output_format):
+        """
+        Args:
+            name: Base file name without extension
+            output_format: 'parquet' or 'csv'
+        """
+        self.filename = f"{name}.{output_format}"
+        self.path = f"{OUTPUT_DIR}/{self.filename}"
+        self.output_format = output_format
+        self.rows = 0
+        self._writer = None
+        self._schema = None
+    
+    def write(self, columns):
+        """Append a chunk to the output file"""
+        if self._writer is None:
+            table = pa.table(columns)
+            self._writer = self._open(table.schema)
+        else:
+            # CSVWriter has no .schema, so the first chunk's schema is kept here
+            table = pa.table(columns, schema=self._schema)
         
-        # Generate 90 days of weather data
-        for day in range(90):
-            date = datetime.now() - timedelta(days=90 - day)
-            
-            # Seasonal rainfall pattern
-            month = date.month
-            if month in [6, 7, 8, 9]:  # Monsoon
-                rainfall = np.random.exponential(8)
-            elif month in [10, 11]:  # Post-monsoon
-                rainfall = np.random.exponential(3)
-            else:  # Dry season
-                rainfall = np.random.exponential(0.5)
-            
-            weather_data.append({
-                'geo_key': geo_key,
-                'latitude': loc['latitude'],
-                'longitude': loc['longitude'],
-                'state': loc['state'],
-                'date': date.strftime('%Y-%m-%d'),
-                'rainfall_mm': round(rainfall, 1),
-                'temperature_max': round(np.random.uniform(28, 42), 1),
-                'temperature_min': round(np.random.uniform(15, 28), 1),
-                'humidity': round(np.random.uniform(40, 90), 1)
-            })
-    
-    return pd.DataFrame(weather_data)
+        self._writer.write_table(table)
+        self.rows += table.num_rows
+    
+    def close(self):
+        """Flush and close the output file"""
+        if self._writer is not None:
+            self._writer.close()
+    
+    def _open(self, schema):
+        self._schema = schema
+        if self.output_format == 'parquet':
+            return pq.ParquetWriter(
+                self.path,
+                schema,
+                compression=PARQUET_COMPRESSION,
+                compression_level=PARQUET_COMPRESSION_LEVEL,
+                use_dictionary=[col for col in DICTIONARY_COLUMNS if col in schema.names]
+            )
+        return pacsv.CSVWriter(self.path, schema)
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Generate synthetic Farmer Credit Score datasets")
+    parser.add_argument(
+        '--format',
+        dest='output_format',
+        choices=OUTPUT_FORMATS,
+        default='parquet',
+        help="Output file format (default: parquet)"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help="Processes generating farmer chunks in parallel (default: 1)"
+    )
+    return parser.parse_args()
 
 def main():
     """Generate all synthetic datasets"""
+    args = parse_args()
     print("Generating synthetic data...")
     print(f"Random seed: {SEED}")
     
-    # Generate farmers
-    print(f"\nGenerating {NUM_FARMERS} farmer profiles...")
-    farmers_df = generate_farmers()
-    farmers_df.to_csv('sample_data/farmers.csv', index=False)
-    print(f"✓ Created farmers.csv ({len(farmers_df)} records)")
-    
-    # Generate satellite data
-    print("\nGenerating satellite NDVI data...")
-    satellite_df = generate_satellite_data(farmers_df)
-    satellite_df.to_csv('sample_data/satellite.csv', index=False)
-    print(f"✓ Created satellite.csv ({len(satellite_df)} records)")
-    
-    # Generate weather data
-    print("\nGenerating weather data...")
-    weather_df = generate_weather_data(farmers_df)
-    weather_df.to_csv('sample_data/weather.csv', index=False)
-    print(f"✓ Created weather.csv ({len(weather_df)} records)")
+    starts = range(0, NUM_FARMERS, CHUNK_SIZE)
+    seed_sequences = np.random.SeedSequence(SEED).spawn(len(starts))
+    chunks = [
+        (seed_sequence, start, min(CHUNK_SIZE, NUM_FARMERS - start))
+        for seed_sequence, start in zip(seed_sequences, starts)
+    ]
+    
+    writers = {name: DatasetWriter(name, args.output_format) for name in DATASETS}
+    summary_chunks = []
+    
+    # Generate farmers with their satellite and weather data chunk by chunk
+    print(f"\nGenerating {NUM_FARMERS} farmer profiles with satellite NDVI and weather data...")
+    pool = Pool(args.workers) if args.workers > 1 else None
+    try:
+        results = pool.imap(generate_chunk, chunks) if pool else map(generate_chunk, chunks)
+        for datasets in results:
+            for name in DATASETS:
+                writers[name].write(datasets[name])
+            farmers = datasets['farmers']
+            summary_chunks.append(pd.DataFrame({col: farmers[col] for col in SUMMARY_COLUMNS}))
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        for writer in writers.values():
+            writer.close()
+    
+    for writer in writers.values():
+        print(f"✓ Created {writer.filename} ({writer.rows} records)")
+    
+    farmers_df = pd.concat(summary_chunks, ignore_index=True)
     
     # Print summary statistics
     print("\n" + "="*60)
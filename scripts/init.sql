@@ -7,6 +7,11 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- Create tables (handled by SQLAlchemy in production)
 -- This is just for manual initialization if needed
 
+-- Latest-score lookup index (created by SQLAlchemy for new databases;
+-- run manually on databases created before it was added):
+-- CREATE INDEX IF NOT EXISTS ix_scores_farmer_computed
+--     ON scores (farmer_id, computed_at DESC) INCLUDE (score, score_band);
+
 -- Grant permissions
 GRANT ALL PRIVILEGES ON DATABASE fcs TO postgres;
 
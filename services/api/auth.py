@@ -3,7 +3,8 @@ Authentication utilities for JWT token management
 """
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -80,7 +81,7 @@ def decode_access_token(token: str) -> TokenData:
         
         return TokenData(username=username, role=role)
     
-    except JWTError:
+    except PyJWTError:
         raise credentials_exception
 
 def get_current_user(
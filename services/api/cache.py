@@ -0,0 +1,65 @@
+"""
+Redis read-through cache for farmer profile lookups
+"""
+import logging
+from typing import Optional
+import redis
+import redis.asyncio as aioredis
+
+from config import settings
+from schemas import FarmerResponse
+
+logger = logging.getLogger(__name__)
+
+# Keep Redis outages from stalling requests; callers fall back to the database
+REDIS_SOCKET_TIMEOUT = 0.25
+
+redis_client = aioredis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+    socket_timeout=REDIS_SOCKET_TIMEOUT
+)
+
+def farmer_cache_key(farmer_id: str) -> str:
+    """Cache key for a farmer profile with its latest score"""
+    return f"farmer:{farmer_id}"
+
+async def get_cached_farmer(farmer_id: str) -> Optional[FarmerResponse]:
+    """
+    Get cached farmer profile
+    
+    Args:
+        farmer_id: Farmer ID
+    
+    Returns:
+        Cached farmer profile, or None on a miss or cache error
+    """
+    try:
+        cached = await redis_client.get(farmer_cache_key(farmer_id))
+    except redis.RedisError as e:
+        logger.warning(f"Farmer cache read failed: {e}")
+        return None
+    
+    if cached is None:
+        return None
+    
+    return FarmerResponse.model_validate_json(cached)
+
+async def cache_farmer(farmer: FarmerResponse) -> None:
+    """Store farmer profile with its latest score for FARMER_CACHE_TTL seconds"""
+    try:
+        await redis_client.setex(
+            farmer_cache_key(farmer.farmer_id),
+            settings.FARMER_CACHE_TTL,
+            farmer.model_dump_json()
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Farmer cache write failed: {e}")
+
+async def invalidate_farmer(farmer_id: str) -> None:
+    """Drop a cached farmer profile after its row or scores change"""
+    try:
+        await redis_client.delete(farmer_cache_key(farmer_id))
+    except redis.RedisError as e:
+        logger.warning(f"Farmer cache invalidation failed: {e}")
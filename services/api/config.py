@@ -1,6 +1,7 @@
 """
 Configuration management for API service
 """
+from functools import cached_property
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -24,18 +25,30 @@ class Settings(BaseSettings):
     DB_USER: str = "postgres"
     DB_PASS: str = "postgres"
     DB_NAME: str = "fcs"
+    # Connections per API process; keep the total across processes under
+    # Postgres max_connections (100 by default)
+    DB_POOL_SIZE: int = 5  # sync engine (auth, batch dispatch)
+    DB_MAX_OVERFLOW: int = 5
+    DB_ASYNC_POOL_SIZE: int = 10  # async engine (hot read/score routes)
+    DB_ASYNC_MAX_OVERFLOW: int = 10
     
-    @property
+    @cached_property
     def DATABASE_URL(self) -> str:
         return f"postgresql://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
     
+    @cached_property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+    
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
+    FARMER_CACHE_TTL: int = 60  # seconds
+    BATCH_SCORE_QUEUE: str = "scoring"  # Celery queue consumed by the worker
     
     # CORS
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:3001"
     
-    @property
+    @cached_property
     def CORS_ORIGINS_LIST(self) -> List[str]:
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
     
@@ -45,9 +58,7 @@ class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: str = "development"
     
-    # ML Model
-    MODEL_PATH: str = "../ml/model.joblib"
-    USE_ML_MODEL: bool = True
+    # ML Model (MODEL_PATH and USE_ML_MODEL are read by services/ml/scoring_service.py)
     FALLBACK_SCORING: bool = True
     
     class Config:
@@ -1,26 +1,52 @@
 """
 Database connection and session management
 """
+import fcntl
+import os
+import tempfile
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from config import settings
 
+# Recycle connections before server-side idle timeouts instead of pinging on every checkout
+POOL_RECYCLE_SECONDS = 3600
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_pre_ping=False,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=POOL_RECYCLE_SECONDS
+)
+
+# Create async database engine for I/O-bound routes
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    pool_pre_ping=False,
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    pool_recycle=POOL_RECYCLE_SECONDS
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factories
+# expire_on_commit=False: objects stay readable after commit without a reload SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Base class for models
 Base = declarative_base()
 
+# Coordinates schema creation across worker processes on the same host
+INIT_DB_LOCK_PATH = os.path.join(tempfile.gettempdir(), "fcs_init_db.lock")
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency to get database session
@@ -34,6 +60,26 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get async database session
+    
+    Yields:
+        Async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def init_db():
-    """Initialize database tables"""
-    Base.metadata.create_all(bind=engine)
+    """
+    Initialize database tables
+    
+    Worker processes starting together take turns on the lock, so only one
+    runs DDL at a time; create_all skips tables that already exist.
+    """
+    with open(INIT_DB_LOCK_PATH, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            Base.metadata.create_all(bind=engine, checkfirst=True)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -3,11 +3,13 @@ Main FastAPI application
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import make_asgi_app
 from contextlib import asynccontextmanager
 import logging
 
 from config import settings
-from database import init_db
+from database import init_db, async_engine
 from routes import auth, farmers, scoring, loan, system
 
 # Configure logging
@@ -27,12 +29,14 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down API")
+    await async_engine.dispose()
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.API_TITLE,
     version=settings.API_VERSION,
     description="Transparent credit scoring for farmers using Agri Stack data",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -52,6 +56,9 @@ app.include_router(scoring.router)
 app.include_router(loan.router)
 app.include_router(system.router)
 
+# Prometheus metrics, served by prometheus_client's ASGI app outside the route handlers
+app.mount("/metrics", make_asgi_app())
+
 @app.get("/")
 def root():
     """Root endpoint"""
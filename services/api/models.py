@@ -1,7 +1,7 @@
 """
 Database models for Farmer Credit Score Engine
 """
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -112,6 +112,16 @@ class Score(Base):
     
     # Relationships
     farmer = relationship("Farmer", back_populates="scores")
+    
+    # Latest-score lookups (WHERE farmer_id = ? ORDER BY computed_at DESC) become a single index seek
+    __table_args__ = (
+        Index(
+            "ix_scores_farmer_computed",
+            "farmer_id",
+            computed_at.desc(),
+            postgresql_include=["score", "score_band"]
+        ),
+    )
 
 class Job(Base):
     """Background job model"""
@@ -55,7 +55,6 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
     
     # Create access token
     access_token_expires = timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
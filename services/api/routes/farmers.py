@@ -2,21 +2,65 @@
 Farmer management routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from datetime import datetime
 
-from database import get_db
+from database import get_async_db
 from models import User, Farmer, Score
 from schemas import FarmerCreate, FarmerResponse
 from auth import get_current_active_user
+from cache import get_cached_farmer, cache_farmer, invalidate_farmer
 
 router = APIRouter(prefix="/farmers", tags=["Farmers"])
 
+# Validates/serializes whole farmer lists in one call instead of one model per row
+farmer_list_adapter = TypeAdapter(List[FarmerResponse])
+
+# Farmer columns selected for list responses (latest_score comes from the scores join)
+FARMER_RESPONSE_COLUMNS = [
+    getattr(Farmer, field) for field in FarmerResponse.model_fields if field != "latest_score"
+]
+
+def latest_score_column():
+    """
+    Correlated subquery selecting each farmer's most recent score
+    
+    Served from ix_scores_farmer_computed, so the latest score loads in the
+    same query as the farmer rows.
+    """
+    return select(Score.score).where(
+        Score.farmer_id == Farmer.id
+    ).order_by(Score.computed_at.desc()).limit(1).correlate(Farmer).scalar_subquery().label("latest_score")
+
+async def fetch_farmer_response(db: AsyncSession, farmer_id: str) -> Optional[FarmerResponse]:
+    """
+    Load a farmer profile with its latest score in one query
+    
+    Args:
+        db: Database session
+        farmer_id: Farmer ID
+    
+    Returns:
+        Farmer profile, or None if the farmer does not exist
+    """
+    result = await db.execute(
+        select(*FARMER_RESPONSE_COLUMNS, latest_score_column()).where(Farmer.farmer_id == farmer_id)
+    )
+    row = result.mappings().first()
+    
+    if row is None:
+        return None
+    
+    return FarmerResponse.model_validate(dict(row))
+
 @router.post("", response_model=FarmerResponse, status_code=status.HTTP_201_CREATED)
-def onboard_farmer(
+async def onboard_farmer(
     farmer_data: FarmerCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -31,30 +75,32 @@ def onboard_farmer(
         Created farmer profile
     """
     # Check if farmer_id already exists
-    existing = db.query(Farmer).filter(Farmer.farmer_id == farmer_data.farmer_id).first()
+    existing = await db.scalar(select(Farmer.id).where(Farmer.farmer_id == farmer_data.farmer_id))
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Farmer with ID {farmer_data.farmer_id} already exists"
         )
     
-    # Create farmer
+    # Create farmer; created_at is set here so no refresh is needed after commit
+    now = datetime.utcnow()
     new_farmer = Farmer(
         **farmer_data.model_dump(),
         created_by=current_user.id,
-        consent_date=datetime.utcnow() if farmer_data.consent_given else None
+        consent_date=now if farmer_data.consent_given else None,
+        created_at=now
     )
     
     db.add(new_farmer)
-    db.commit()
-    db.refresh(new_farmer)
+    await db.commit()
+    await invalidate_farmer(new_farmer.farmer_id)
     
     return new_farmer
 
 @router.get("/{farmer_id}", response_model=FarmerResponse)
-def get_farmer(
+async def get_farmer(
     farmer_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -68,30 +114,27 @@ def get_farmer(
     Returns:
         Farmer profile with latest score
     """
-    farmer = db.query(Farmer).filter(Farmer.farmer_id == farmer_id).first()
+    cached = await get_cached_farmer(farmer_id)
+    if cached:
+        return cached
+    
+    farmer_response = await fetch_farmer_response(db, farmer_id)
     
-    if not farmer:
+    if not farmer_response:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Farmer {farmer_id} not found"
         )
     
-    # Get latest score
-    latest_score = db.query(Score).filter(
-        Score.farmer_id == farmer.id
-    ).order_by(Score.computed_at.desc()).first()
-    
-    farmer_response = FarmerResponse.model_validate(farmer)
-    if latest_score:
-        farmer_response.latest_score = latest_score.score
+    await cache_farmer(farmer_response)
     
     return farmer_response
 
 @router.get("", response_model=List[FarmerResponse])
-def list_farmers(
+async def list_farmers(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -106,19 +149,12 @@ def list_farmers(
     Returns:
         List of farmer profiles
     """
-    farmers = db.query(Farmer).offset(skip).limit(limit).all()
-    
-    # Add latest scores
-    farmer_responses = []
-    for farmer in farmers:
-        latest_score = db.query(Score).filter(
-            Score.farmer_id == farmer.id
-        ).order_by(Score.computed_at.desc()).first()
-        
-        farmer_response = FarmerResponse.model_validate(farmer)
-        if latest_score:
-            farmer_response.latest_score = latest_score.score
-        
-        farmer_responses.append(farmer_response)
-    
-    return farmer_responses
+    # Latest score per farmer is looked up only for the page being returned
+    result = await db.execute(
+        select(*FARMER_RESPONSE_COLUMNS, latest_score_column()).order_by(
+            Farmer.id
+        ).offset(skip).limit(limit)
+    )
+    
+    farmers = farmer_list_adapter.validate_python(result.mappings().all())
+    return ORJSONResponse(content=farmer_list_adapter.dump_python(farmers))
@@ -2,13 +2,24 @@
 Loan eligibility routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+import numpy as np
 
-from database import get_db
-from models import User, Farmer, Score
-from schemas import LoanQuoteRequest, LoanQuoteResponse, EMIPlan
+from database import get_async_db
+from models import User, Farmer
+from schemas import LoanQuoteRequest, LoanQuoteBatchRequest, LoanQuoteResponse, EMIPlan
 from auth import get_current_active_user
+from cache import get_cached_farmer, cache_farmer
+from routes.farmers import fetch_farmer_response, latest_score_column
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the batch kernels run as plain NumPy
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 router = APIRouter(prefix="/loan", tags=["Loan"])
 
@@ -20,18 +31,92 @@ CROP_CYCLES = {
     'maize': 4
 }
 
+# Base loan amount per hectare (₹)
+BASE_LOAN_PER_HECTARE = 50000
+
+# Minimum score for loan eligibility
+MIN_ELIGIBLE_SCORE = 30
+
+# Annual interest rate (8% to 12%) for every score tenth from 0.0 to 100.0;
+# scores are stored to one decimal, so lookups match the formula exactly
+BASE_RATE_LUT = 12 - (np.arange(1001) / 10 / 100) * 4
+
 def calculate_max_loan(score: float, land_area: float) -> float:
     """Calculate maximum loan amount based on score and land area"""
-    # Base amount per hectare
-    base_per_hectare = 50000  # ₹50,000 per hectare
-    
     # Score multiplier (0.4 to 1.2)
     score_multiplier = 0.4 + (score / 100) * 0.8
     
-    max_loan = land_area * base_per_hectare * score_multiplier
+    max_loan = land_area * BASE_LOAN_PER_HECTARE * score_multiplier
     
     return round(max_loan, 2)
 
+def calculate_emi(principal, monthly_rate, n_months):
+    """
+    Compute the equated monthly instalment for an amortized loan
+    
+    Works element-wise on NumPy arrays as well as on scalars, so many
+    quotes can be priced in one call.
+    
+    Args:
+        principal: Loan amount
+        monthly_rate: Monthly interest rate as a fraction
+        n_months: Loan duration in months
+    
+    Returns:
+        Monthly instalment amount
+    """
+    growth = (1 + monthly_rate) ** n_months
+    return principal * monthly_rate * growth / (growth - 1)
+
+def base_interest_rate(score: float) -> float:
+    """Annual interest rate (%) for a credit score"""
+    return float(BASE_RATE_LUT[min(1000, max(0, round(score * 10)))])
+
+# Compiled copy of calculate_emi for whole arrays of quotes
+emi_batch = njit(cache=True)(calculate_emi)
+
+@njit(cache=True)
+def quote_batch(scores, land_areas, requested_amounts, crop_cycle_months):
+    """
+    Price many loan quotes in one pass
+    
+    Mirrors calculate_max_loan and generate_emi_plans element-wise.
+    
+    Args:
+        scores: Credit scores (0-100)
+        land_areas: Land areas in hectares
+        requested_amounts: Requested loan amounts, NaN where none was requested
+        crop_cycle_months: Crop cycle length in months
+    
+    Returns:
+        Tuple of arrays: max loan, recommended amount, loan amount, annual
+        interest rate (%), bullet repayment, 12-month EMI, 24-month EMI
+    """
+    max_loans = np.round(land_areas * BASE_LOAN_PER_HECTARE * (0.4 + (scores / 100) * 0.8), 2)
+    recommended = max_loans * 0.8
+    loan_amounts = np.minimum(
+        np.where(np.isnan(requested_amounts), recommended, requested_amounts),
+        max_loans
+    )
+    
+    base_rates = BASE_RATE_LUT[np.minimum(np.maximum(np.rint(scores * 10), 0), 1000).astype(np.int64)]
+    monthly_rates = base_rates / 12 / 100
+    bullet_repayments = np.round(loan_amounts * (1 + base_rates / 100 * crop_cycle_months / 12), 2)
+    emi_12 = emi_batch(loan_amounts, monthly_rates, 12)
+    emi_24 = emi_batch(loan_amounts, monthly_rates, 24)
+    
+    return max_loans, recommended, loan_amounts, base_rates, bullet_repayments, emi_12, emi_24
+
+def quote_remarks(score: float) -> str:
+    """Explain the quote outcome for a credit score"""
+    if score >= 70:
+        return "Excellent credit profile. Eligible for premium rates."
+    elif score >= 50:
+        return "Good credit profile. Standard rates applicable."
+    elif score >= MIN_ELIGIBLE_SCORE:
+        return "Fair credit profile. Higher interest rates may apply."
+    return "Credit score below threshold. Loan not recommended."
+
 def generate_emi_plans(
     loan_amount: float,
     score: float,
@@ -41,20 +126,20 @@ def generate_emi_plans(
     plans = []
     
     # Base interest rate (8% to 12% based on score)
-    base_rate = 12 - (score / 100) * 4
+    base_rate = base_interest_rate(score)
     
     # Plan 1: Crop cycle aligned (bullet payment)
+    bullet_repayment = round(loan_amount * (1 + base_rate/100 * crop_cycle_months/12), 2)
     plans.append(EMIPlan(
-        emi_amount=round(loan_amount * (1 + base_rate/100 * crop_cycle_months/12), 2),
+        emi_amount=bullet_repayment,
         duration_months=crop_cycle_months,
         interest_rate=round(base_rate, 2),
-        total_repayment=round(loan_amount * (1 + base_rate/100 * crop_cycle_months/12), 2)
+        total_repayment=bullet_repayment
     ))
     
     # Plan 2: 12 months
     monthly_rate = base_rate / 12 / 100
-    n = 12
-    emi_12 = loan_amount * monthly_rate * (1 + monthly_rate)**n / ((1 + monthly_rate)**n - 1)
+    emi_12 = calculate_emi(loan_amount, monthly_rate, 12)
     plans.append(EMIPlan(
         emi_amount=round(emi_12, 2),
         duration_months=12,
@@ -64,8 +149,7 @@ def generate_emi_plans(
     
     # Plan 3: 24 months (if score > 50)
     if score > 50:
-        n = 24
-        emi_24 = loan_amount * monthly_rate * (1 + monthly_rate)**n / ((1 + monthly_rate)**n - 1)
+        emi_24 = calculate_emi(loan_amount, monthly_rate, 24)
         plans.append(EMIPlan(
             emi_amount=round(emi_24, 2),
             duration_months=24,
@@ -76,9 +160,9 @@ def generate_emi_plans(
     return plans
 
 @router.post("/quote", response_model=LoanQuoteResponse)
-def get_loan_quote(
+async def get_loan_quote(
     request: LoanQuoteRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -92,32 +176,33 @@ def get_loan_quote(
     Returns:
         Loan eligibility with EMI plans
     """
-    # Get farmer
-    farmer = db.query(Farmer).filter(Farmer.farmer_id == request.farmer_id).first()
+    # Get farmer profile with latest score (cached)
+    farmer = await get_cached_farmer(request.farmer_id)
     
-    if not farmer:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Farmer {request.farmer_id} not found"
-        )
+    if farmer is None:
+        farmer = await fetch_farmer_response(db, request.farmer_id)
+        
+        if not farmer:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Farmer {request.farmer_id} not found"
+            )
+        
+        await cache_farmer(farmer)
     
-    # Get latest score
-    latest_score = db.query(Score).filter(
-        Score.farmer_id == farmer.id
-    ).order_by(Score.computed_at.desc()).first()
+    score_value = farmer.latest_score
     
-    if not latest_score:
+    if score_value is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No credit score found. Please compute score first."
         )
     
-    score_value = latest_score.score
     land_area = farmer.land_area or 2.0
     crop_type = farmer.crop_type or 'rice'
     
     # Calculate eligibility
-    eligible = score_value >= 30  # Minimum score for eligibility
+    eligible = score_value >= MIN_ELIGIBLE_SCORE
     max_loan = calculate_max_loan(score_value, land_area)
     recommended = max_loan * 0.8  # Recommend 80% of max
     
@@ -130,16 +215,6 @@ def get_loan_quote(
     
     emi_plans = generate_emi_plans(loan_amount, score_value, crop_cycle_months)
     
-    # Generate remarks
-    if score_value >= 70:
-        remarks = "Excellent credit profile. Eligible for premium rates."
-    elif score_value >= 50:
-        remarks = "Good credit profile. Standard rates applicable."
-    elif score_value >= 30:
-        remarks = "Fair credit profile. Higher interest rates may apply."
-    else:
-        remarks = "Credit score below threshold. Loan not recommended."
-    
     return LoanQuoteResponse(
         farmer_id=request.farmer_id,
         credit_score=score_value,
@@ -148,5 +223,102 @@ def get_loan_quote(
         recommended_amount=recommended,
         emi_plans=emi_plans,
         crop_cycle_months=crop_cycle_months,
-        remarks=remarks
+        remarks=quote_remarks(score_value)
+    )
+
+@router.post("/quote/batch", response_model=List[LoanQuoteResponse])
+async def get_loan_quote_batch(
+    request: LoanQuoteBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get loan eligibility and EMI quotes for many farmers at once
+    
+    Args:
+        request: Loan quote requests (up to 500)
+        db: Database session
+        current_user: Authenticated user
+    
+    Returns:
+        Loan quotes in request order
+    """
+    farmer_ids = {quote.farmer_id for quote in request.quotes}
+    
+    # Latest score per requested farmer, fetched with the farmers in one query
+    result = await db.execute(
+        select(
+            Farmer.farmer_id,
+            Farmer.land_area,
+            Farmer.crop_type,
+            latest_score_column()
+        ).where(Farmer.farmer_id.in_(farmer_ids))
     )
+    farmers = {row.farmer_id: row for row in result}
+    
+    missing = sorted(farmer_ids - farmers.keys())
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Farmers not found: {', '.join(missing)}"
+        )
+    
+    unscored = sorted(farmer_id for farmer_id, row in farmers.items() if row.latest_score is None)
+    if unscored:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No credit score found for: {', '.join(unscored)}. Please compute score first."
+        )
+    
+    rows = [farmers[quote.farmer_id] for quote in request.quotes]
+    scores = np.array([row.latest_score for row in rows], dtype=np.float64)
+    crop_cycles = np.array(
+        [CROP_CYCLES.get(row.crop_type or 'rice', 4) for row in rows], dtype=np.int64
+    )
+    max_loans, recommended, loan_amounts, base_rates, bullets, emi_12, emi_24 = quote_batch(
+        scores,
+        np.array([row.land_area or 2.0 for row in rows], dtype=np.float64),
+        np.array([quote.requested_amount or np.nan for quote in request.quotes], dtype=np.float64),
+        crop_cycles
+    )
+    
+    quotes = []
+    for i, quote in enumerate(request.quotes):
+        score_value = float(scores[i])
+        crop_cycle_months = int(crop_cycles[i])
+        interest_rate = round(float(base_rates[i]), 2)
+        
+        emi_plans = [
+            EMIPlan(
+                emi_amount=float(bullets[i]),
+                duration_months=crop_cycle_months,
+                interest_rate=interest_rate,
+                total_repayment=float(bullets[i])
+            ),
+            EMIPlan(
+                emi_amount=round(float(emi_12[i]), 2),
+                duration_months=12,
+                interest_rate=interest_rate,
+                total_repayment=round(float(emi_12[i]) * 12, 2)
+            )
+        ]
+        if score_value > 50:
+            emi_plans.append(EMIPlan(
+                emi_amount=round(float(emi_24[i]), 2),
+                duration_months=24,
+                interest_rate=interest_rate,
+                total_repayment=round(float(emi_24[i]) * 24, 2)
+            ))
+        
+        quotes.append(LoanQuoteResponse(
+            farmer_id=quote.farmer_id,
+            credit_score=score_value,
+            eligible=score_value >= MIN_ELIGIBLE_SCORE,
+            max_loan_amount=float(max_loans[i]),
+            recommended_amount=float(recommended[i]),
+            emi_plans=emi_plans,
+            crop_cycle_months=crop_cycle_months,
+            remarks=quote_remarks(score_value)
+        ))
+    
+    return quotes
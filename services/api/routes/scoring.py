@@ -1,54 +1,39 @@
 """
 Scoring routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, status, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
-import sys
-import os
+from typing import List, Optional
+from datetime import datetime, timezone
+import logging
 import uuid
 
-# Add ML module to path
-ml_path = os.path.join(os.path.dirname(__file__), '../../ml')
-sys.path.insert(0, ml_path)
-
-from database import get_db
+from database import get_db, get_async_db
 from models import User, Farmer, Score, Job
 from schemas import (
     ScoreRequest,
     ScoreResponse,
-    Driver,
     ScoreHistoryResponse,
     BatchScoreRequest,
     BatchScoreResponse
 )
 from auth import get_current_active_user
-from config import settings
+from cache import invalidate_farmer
+from scoring_service import get_score_band, build_farmer_data, score_farmer
+from tasks import dispatch_batch_score
 
-# Import ML module
-try:
-    from model import get_model
-    ML_AVAILABLE = True
-except ImportError:
-    ML_AVAILABLE = False
-    print("Warning: ML module not available")
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/score", tags=["Scoring"])
 
-def get_score_band(score: float) -> str:
-    """Determine score band from score value"""
-    if score < 40:
-        return "low"
-    elif score < 70:
-        return "medium"
-    else:
-        return "high"
-
 @router.post("", response_model=ScoreResponse)
-def compute_score(
+async def compute_score(
     request: ScoreRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -62,8 +47,17 @@ def compute_score(
     Returns:
         Computed score with drivers
     """
-    # Get farmer
-    farmer = db.query(Farmer).filter(Farmer.farmer_id == request.farmer_id).first()
+    # Get only the farmer columns scoring reads
+    result = await db.execute(
+        select(
+            Farmer.id,
+            Farmer.farmer_id,
+            Farmer.consent_given,
+            Farmer.land_area,
+            Farmer.crop_type
+        ).where(Farmer.farmer_id == request.farmer_id)
+    )
+    farmer = result.first()
     
     if not farmer:
         raise HTTPException(
@@ -78,39 +72,12 @@ def compute_score(
         )
     
     # Prepare farmer data
-    farmer_data = {
-        'farmer_id': farmer.farmer_id,
-        'land_area': farmer.land_area or 2.0,
-        'crop_type': farmer.crop_type or 'rice',
-        'last_year_yield_est': 3.0,  # Default, should come from Farm model
-        'ndvi_mean': 0.6,  # Default, should come from satellite data
-        'ndvi_trend': 0.05,
-        'rainfall_anomaly_3mo': 0.0,
-        'past_kcc_defaults': 0,
-        'upi_txn_freq': 15,
-        'market_price_volatility': 15.0,
-        'fpo_membership_flag': 0,
-        'distance_to_mandi_km': 20.0
-    }
-    
-    # Compute score using ML model or deterministic fallback
-    try:
-        if ML_AVAILABLE and settings.USE_ML_MODEL:
-            model = get_model(settings.MODEL_PATH if os.path.exists(settings.MODEL_PATH) else None)
-            score_value, drivers_data = model.predict(farmer_data)
-            model_type = "ml" if model.model is not None else "deterministic"
-        else:
-            from scoring import compute_deterministic_score
-            score_value, drivers_data = compute_deterministic_score(farmer_data)
-            model_type = "deterministic"
-    except Exception as e:
-        print(f"Scoring error: {e}")
-        # Fallback to deterministic
-        from scoring import compute_deterministic_score
-        score_value, drivers_data = compute_deterministic_score(farmer_data)
-        model_type = "deterministic"
-    
-    # Save score to database
+    farmer_data = build_farmer_data(farmer)
+    
+    # Model inference is CPU-bound; keep it off the event loop
+    score_value, drivers_data, model_type = await run_in_threadpool(score_farmer, farmer_data)
+    
+    # Save score to database; computed_at is set here so no refresh is needed after commit
     new_score = Score(
         farmer_id=farmer.id,
         score=score_value,
@@ -119,30 +86,34 @@ def compute_score(
         drivers=drivers_data,
         model_version="1.0",
         model_type=model_type,
-        computed_by=current_user.id
+        computed_by=current_user.id,
+        computed_at=datetime.utcnow()
     )
     
     db.add(new_score)
-    db.commit()
-    db.refresh(new_score)
+    await db.commit()
+    await invalidate_farmer(farmer.farmer_id)
     
-    # Prepare response
-    drivers = [Driver(**d) for d in drivers_data]
-    
-    return ScoreResponse(
+    # Fields come from our own scorer; skip pydantic validation
+    response = ScoreResponse.model_construct(
         farmer_id=farmer.farmer_id,
         score=score_value,
         score_band=get_score_band(score_value),
-        drivers=drivers,
+        drivers=drivers_data,
         model_type=model_type,
         computed_at=new_score.computed_at
     )
+    
+    # Serialize straight to orjson instead of re-encoding via response_model
+    return ORJSONResponse(content=response.model_dump())
 
 @router.get("/{farmer_id}/history", response_model=ScoreHistoryResponse)
-def get_score_history(
+async def get_score_history(
     farmer_id: str,
-    limit: int = 10,
-    db: Session = Depends(get_db),
+    limit: int = Query(10, ge=1, le=100),
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -150,42 +121,69 @@ def get_score_history(
     
     Args:
         farmer_id: Farmer ID
-        limit: Maximum number of scores to return
+        limit: Maximum number of scores to return (1-100)
+        before: Only return scores computed before this time (keyset cursor;
+            pass the last computed_at of the previous page)
+        before_id: With before, the last id of the previous page; scores at
+            exactly that computed_at with a lower id are returned as well
         db: Database session
         current_user: Authenticated user
     
     Returns:
         Score history
     """
-    farmer = db.query(Farmer).filter(Farmer.farmer_id == farmer_id).first()
+    farmer_pk = await db.scalar(select(Farmer.id).where(Farmer.farmer_id == farmer_id))
     
-    if not farmer:
+    if farmer_pk is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Farmer {farmer_id} not found"
         )
     
-    # Get score history
-    scores = db.query(Score).filter(
-        Score.farmer_id == farmer.id
-    ).order_by(Score.computed_at.desc()).limit(limit).all()
-    
-    score_responses = []
-    for score in scores:
-        drivers = [Driver(**d) for d in score.drivers]
-        score_responses.append(ScoreResponse(
-            farmer_id=farmer_id,
-            score=score.score,
-            score_band=score.score_band,
-            drivers=drivers,
-            model_type=score.model_type,
-            computed_at=score.computed_at
-        ))
-    
-    return ScoreHistoryResponse(
-        farmer_id=farmer_id,
-        scores=score_responses
+    # Get score history (only the columns returned; skips the features blob)
+    query = select(
+        Score.id,
+        Score.score,
+        Score.score_band,
+        Score.drivers,
+        Score.model_type,
+        Score.computed_at
+    ).where(Score.farmer_id == farmer_pk)
+    
+    if before is not None:
+        # computed_at is timestamptz; pin the cursor to UTC (naive values are taken as UTC)
+        if before.tzinfo is None:
+            before = before.replace(tzinfo=timezone.utc)
+        else:
+            before = before.astimezone(timezone.utc)
+        if before_id is not None:
+            # computed_at is not unique; id breaks ties so a page boundary never skips rows
+            query = query.where(tuple_(Score.computed_at, Score.id) < tuple_(before, before_id))
+        else:
+            query = query.where(Score.computed_at < before)
+    
+    # Walks ix_scores_farmer_computed from the cursor, so the cost is bounded by limit
+    result = await db.execute(
+        query.order_by(Score.computed_at.desc(), Score.id.desc()).limit(limit)
     )
+    scores = result.all()
+    
+    # Stored drivers are already JSON-shaped; pass them through without pydantic round-trips
+    return ORJSONResponse(content={
+        "farmer_id": farmer_id,
+        "scores": [
+            {
+                "id": score.id,
+                "farmer_id": farmer_id,
+                "score": score.score,
+                "score_band": score.score_band,
+                "drivers": score.drivers or [],
+                "model_type": score.model_type,
+                "computed_at": score.computed_at
+            }
+            for score in scores
+        ]
+    })
 
 @router.post("/batch", response_model=BatchScoreResponse)
 def batch_score(
@@ -197,6 +195,8 @@ def batch_score(
     """
     Submit batch scoring job
     
+    The job is scored by the worker service; poll /jobs/{job_id} for its status.
+    
     Args:
         request: Batch score request with farmer IDs
         background_tasks: FastAPI background tasks
@@ -220,8 +220,17 @@ def batch_score(
     db.add(new_job)
     db.commit()
     
-    # In a real implementation, this would trigger a Celery task
-    # For now, we'll just mark it as pending
+    try:
+        dispatch_batch_score(job_id)
+    except Exception:
+        logger.exception("Batch scoring dispatch error")
+        new_job.status = "failed"
+        new_job.error_message = "Could not queue batch scoring job"
+        db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Batch scoring is temporarily unavailable"
+        )
     
     return BatchScoreResponse(
         job_id=job_id,
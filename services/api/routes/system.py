@@ -2,13 +2,13 @@
 Job status and health check routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
-from fastapi.responses import Response
+from prometheus_client import Counter, Histogram
 import time
 
-from database import get_db
+from database import get_async_db
 from models import Job, User
 from schemas import JobStatus, HealthResponse
 from auth import get_current_active_user
@@ -21,10 +21,13 @@ request_count = Counter('api_requests_total', 'Total API requests', ['method', '
 request_duration = Histogram('api_request_duration_seconds', 'API request duration')
 score_compute_count = Counter('score_computations_total', 'Total score computations')
 
+# Database liveness probe, built once
+HEALTH_PING = text("SELECT 1")
+
 @router.get("/jobs/{job_id}", response_model=JobStatus)
-def get_job_status(
+async def get_job_status(
     job_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
@@ -38,7 +41,7 @@ def get_job_status(
     Returns:
         Job status
     """
-    job = db.query(Job).filter(Job.job_id == job_id).first()
+    job = await db.scalar(select(Job).where(Job.job_id == job_id))
     
     if not job:
         raise HTTPException(
@@ -49,7 +52,7 @@ def get_job_status(
     return job
 
 @router.get("/healthz", response_model=HealthResponse)
-def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_async_db)):
     """
     Health check endpoint
     
@@ -58,7 +61,7 @@ def health_check(db: Session = Depends(get_db)):
     """
     # Check database
     try:
-        db.execute("SELECT 1")
+        await db.execute(HEALTH_PING)
         db_status = "healthy"
     except Exception:
         db_status = "unhealthy"
@@ -86,13 +89,3 @@ def readiness_check():
     """
     # In production, check if all dependencies are ready
     return {"status": "ready"}
-
-@router.get("/metrics")
-def metrics():
-    """
-    Prometheus metrics endpoint
-    
-    Returns:
-        Prometheus metrics in text format
-    """
-    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
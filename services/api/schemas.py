@@ -62,22 +62,20 @@ class FarmerResponse(BaseModel):
 class ScoreRequest(BaseModel):
     farmer_id: str
 
-class Driver(BaseModel):
-    feature: str
-    impact: float
-    explanation: str
-
 class ScoreResponse(BaseModel):
     farmer_id: str
     score: float = Field(..., ge=0, le=100)
     score_band: str
-    drivers: List[Driver]
+    drivers: List[Dict[str, Any]]  # feature, impact, explanation; produced by the scorer
     model_type: str
     computed_at: datetime
 
+class ScoreHistoryItem(ScoreResponse):
+    id: int  # tie-breaker for the (computed_at, id) history cursor
+
 class ScoreHistoryResponse(BaseModel):
     farmer_id: str
-    scores: List[ScoreResponse]
+    scores: List[ScoreHistoryItem]
 
 # Batch Score Schemas
 class BatchScoreRequest(BaseModel):
@@ -108,6 +106,9 @@ class LoanQuoteRequest(BaseModel):
     farmer_id: str
     requested_amount: Optional[float] = Field(None, gt=0)
 
+class LoanQuoteBatchRequest(BaseModel):
+    quotes: List[LoanQuoteRequest] = Field(..., min_length=1, max_length=500)
+
 class EMIPlan(BaseModel):
     emi_amount: float
     duration_months: int
@@ -0,0 +1,17 @@
+"""
+Celery client for dispatching background jobs to the worker service
+"""
+from celery import Celery
+
+from config import settings
+
+celery_app = Celery("fcs_api", broker=settings.REDIS_URL, backend=settings.REDIS_URL)
+
+def dispatch_batch_score(job_id: str) -> None:
+    """
+    Queue a batch_score job for the worker
+    
+    Args:
+        job_id: ID of the pending Job row holding the farmer IDs
+    """
+    celery_app.send_task("batch_score_task", args=[job_id], queue=settings.BATCH_SCORE_QUEUE)
@@ -1,22 +1,43 @@
+import os
+import tempfile
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 from fastapi.testclient import TestClient
 from main import app
-from database import Base, get_db
+from database import Base, get_db, get_async_db
 from models import User, Farmer, Score
+from auth import get_password_hash, create_access_token
 
-# Use in-memory SQLite for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Use a temporary SQLite file for testing so the sync fixture session and the
+# async route sessions see the same data
+TEST_DB_PATH = os.path.join(tempfile.mkdtemp(), "test.db")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{TEST_DB_PATH}"
+SQLALCHEMY_ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_DB_PATH}"
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False}
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# NullPool: each TestClient runs its own event loop, so connections must not be reused across tests
+async_engine = create_async_engine(SQLALCHEMY_ASYNC_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+@pytest.fixture(scope="session")
+def password_hash():
+    """
+    bcrypt hash of the test password "password123", computed once per session.
+    """
+    return get_password_hash("password123")
+
 @pytest.fixture(scope="function")
 def db():
     """
@@ -30,10 +51,34 @@ def db():
         db.close()
         Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture(scope="function")
+def test_user(db, password_hash):
+    """
+    Create the agent user that authenticated tests act as.
+    """
+    user = User(
+        username="testagent",
+        email="testagent@example.com",
+        hashed_password=password_hash,
+        role="agent"
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+@pytest.fixture(scope="function")
+def auth_headers(test_user):
+    """
+    Bearer token headers for test_user, signed directly rather than through /auth/login.
+    """
+    token = create_access_token({"sub": test_user.username, "role": test_user.role})
+    return {"Authorization": f"Bearer {token}"}
+
 @pytest.fixture(scope="function")
 def client(db):
     """
-    Create a fresh TestClient for each test case, overriding the database dependency.
+    Create a fresh TestClient for each test case, overriding the database dependencies.
     """
     def override_get_db():
         try:
@@ -41,7 +86,12 @@ def client(db):
         finally:
             pass
     
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
@@ -1,7 +1,6 @@
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from models import User
-from auth import get_password_hash
 
 def test_register_user(client: TestClient, db: Session):
     response = client.post(
@@ -24,12 +23,12 @@ def test_register_user(client: TestClient, db: Session):
     assert user.email == "test@example.com"
     assert user.role == "agent"
 
-def test_register_existing_username(client: TestClient, db: Session):
+def test_register_existing_username(client: TestClient, db: Session, password_hash: str):
     # Create existing user
     user = User(
         username="existing",
         email="existing@example.com",
-        hashed_password=get_password_hash("password123"),
+        hashed_password=password_hash,
         role="agent"
     )
     db.add(user)
@@ -47,12 +46,12 @@ def test_register_existing_username(client: TestClient, db: Session):
     assert response.status_code == 400
     assert response.json()["detail"] == "Username already registered"
 
-def test_register_existing_email(client: TestClient, db: Session):
+def test_register_existing_email(client: TestClient, db: Session, password_hash: str):
     # Create existing user
     user = User(
         username="user1",
         email="existing@example.com",
-        hashed_password=get_password_hash("password123"),
+        hashed_password=password_hash,
         role="agent"
     )
     db.add(user)
@@ -70,14 +69,13 @@ def test_register_existing_email(client: TestClient, db: Session):
     assert response.status_code == 400
     assert response.json()["detail"] == "Email already registered"
 
-def test_login_success(client: TestClient, db: Session):
+def test_login_success(client: TestClient, db: Session, password_hash: str):
     # Create user
     password = "password123"
-    hashed = get_password_hash(password)
     user = User(
         username="loginuser",
         email="login@example.com",
-        hashed_password=hashed,
+        hashed_password=password_hash,
         role="agent"
     )
     db.add(user)
@@ -95,14 +93,12 @@ def test_login_success(client: TestClient, db: Session):
     assert "access_token" in data
     assert data["token_type"] == "bearer"
 
-def test_login_failure(client: TestClient, db: Session):
+def test_login_failure(client: TestClient, db: Session, password_hash: str):
     # Create user
-    password = "password123"
-    hashed = get_password_hash(password)
     user = User(
         username="loginuser",
         email="login@example.com",
-        hashed_password=hashed,
+        hashed_password=password_hash,
         role="agent"
     )
     db.add(user)
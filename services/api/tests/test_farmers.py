@@ -1,36 +1,12 @@
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from models import User, Farmer, Score
-from auth import get_password_hash
 from datetime import datetime
 
-def create_test_user(db: Session, role: str = "agent") -> User:
-    user = User(
-        username=f"test{role}",
-        email=f"test{role}@example.com",
-        hashed_password=get_password_hash("password123"),
-        role=role
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
-
-def get_auth_headers(client: TestClient, username: str = "testagent"):
-    response = client.post(
-        "/auth/login",
-        json={"username": username, "password": "password123"}
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-def test_onboard_farmer(client: TestClient, db: Session):
-    create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_onboard_farmer(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     response = client.post(
         "/farmers",
-        headers=headers,
+        headers=auth_headers,
         json={
             "farmer_id": "FRM001",
             "name": "Ramesh Kumar",
@@ -53,23 +29,20 @@ def test_onboard_farmer(client: TestClient, db: Session):
     assert farmer is not None
     assert farmer.consent_given is True
 
-def test_onboard_existing_farmer(client: TestClient, db: Session):
-    user = create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_onboard_existing_farmer(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     # Create existing farmer
     farmer = Farmer(
         farmer_id="FRM001",
         name="Existing Farmer",
         mobile="9999999999",
-        created_by=user.id
+        created_by=test_user.id
     )
     db.add(farmer)
     db.commit()
     
     response = client.post(
         "/farmers",
-        headers=headers,
+        headers=auth_headers,
         json={
             "farmer_id": "FRM001",
             "name": "New Name",
@@ -79,16 +52,13 @@ def test_onboard_existing_farmer(client: TestClient, db: Session):
     assert response.status_code == 400
     assert "already exists" in response.json()["detail"]
 
-def test_get_farmer(client: TestClient, db: Session):
-    user = create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_get_farmer(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     # Create farmer with score
     farmer = Farmer(
         farmer_id="FRM002",
         name="Suresh Singh",
         mobile="8888888888",
-        created_by=user.id
+        created_by=test_user.id
     )
     db.add(farmer)
     db.commit()
@@ -102,25 +72,41 @@ def test_get_farmer(client: TestClient, db: Session):
     db.add(score)
     db.commit()
     
-    response = client.get(f"/farmers/FRM002", headers=headers)
+    response = client.get(f"/farmers/FRM002", headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
     assert data["farmer_id"] == "FRM002"
     assert data["latest_score"] == 75.5
 
-def test_list_farmers(client: TestClient, db: Session):
-    user = create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_list_farmers(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     # Create 2 farmers
-    f1 = Farmer(farmer_id="F1", name="Farmer 1", mobile="111", created_by=user.id)
-    f2 = Farmer(farmer_id="F2", name="Farmer 2", mobile="222", created_by=user.id)
+    f1 = Farmer(farmer_id="F1", name="Farmer 1", mobile="111", created_by=test_user.id)
+    f2 = Farmer(farmer_id="F2", name="Farmer 2", mobile="222", created_by=test_user.id)
     db.add_all([f1, f2])
     db.commit()
     
-    response = client.get("/farmers", headers=headers)
+    response = client.get("/farmers", headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 2
     assert data[0]["farmer_id"] == "F1"
     assert data[1]["farmer_id"] == "F2"
+
+def test_list_farmers_latest_score(client: TestClient, db: Session, test_user: User, auth_headers: dict):
+    f1 = Farmer(farmer_id="F1", name="Farmer 1", mobile="111", created_by=test_user.id)
+    f2 = Farmer(farmer_id="F2", name="Farmer 2", mobile="222", created_by=test_user.id)
+    db.add_all([f1, f2])
+    db.commit()
+    
+    # Only the most recent score should be reported for F1
+    db.add_all([
+        Score(farmer_id=f1.id, score=40.0, score_band="medium", computed_at=datetime(2024, 1, 1)),
+        Score(farmer_id=f1.id, score=65.0, score_band="medium", computed_at=datetime(2024, 6, 1)),
+    ])
+    db.commit()
+    
+    response = client.get("/farmers", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["latest_score"] == 65.0
+    assert data[1]["latest_score"] is None
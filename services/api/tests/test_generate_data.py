@@ -0,0 +1,22 @@
+import sys
+import pytest
+
+pytest.importorskip("pyarrow")
+import pyarrow.csv as pacsv
+import generate_synthetic_data
+
+def test_generate_csv_across_chunks(tmp_path, monkeypatch):
+    # Three chunks, so the CSV writer is appended to after it is opened
+    monkeypatch.setattr(generate_synthetic_data, "OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(generate_synthetic_data, "NUM_FARMERS", 25)
+    monkeypatch.setattr(generate_synthetic_data, "CHUNK_SIZE", 10)
+    monkeypatch.setattr(sys, "argv", ["generate_synthetic_data.py", "--format", "csv"])
+    
+    generate_synthetic_data.main()
+    
+    farmers = pacsv.read_csv(tmp_path / "farmers.csv")
+    assert farmers.num_rows == 25
+    assert farmers.column("farmer_id").to_pylist()[-1] == "FRM000025"
+    
+    satellite = pacsv.read_csv(tmp_path / "satellite.csv")
+    assert satellite.num_rows == 25 * generate_synthetic_data.NUM_SATELLITE_MONTHS
@@ -1,33 +1,9 @@
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from models import User, Farmer, Score
-from auth import get_password_hash
 from datetime import datetime
 
-def create_test_user(db: Session, role: str = "agent") -> User:
-    user = User(
-        username=f"test{role}",
-        email=f"test{role}@example.com",
-        hashed_password=get_password_hash("password123"),
-        role=role
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
-
-def get_auth_headers(client: TestClient, username: str = "testagent"):
-    response = client.post(
-        "/auth/login",
-        json={"username": username, "password": "password123"}
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-def test_get_loan_quote_eligible(client: TestClient, db: Session):
-    user = create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_get_loan_quote_eligible(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     # Create farmer with high score
     farmer = Farmer(
         farmer_id="FRM006",
@@ -35,7 +11,7 @@ def test_get_loan_quote_eligible(client: TestClient, db: Session):
         mobile="4444444444",
         land_area=2.0,
         crop_type="wheat",
-        created_by=user.id
+        created_by=test_user.id
     )
     db.add(farmer)
     db.commit()
@@ -51,7 +27,7 @@ def test_get_loan_quote_eligible(client: TestClient, db: Session):
     
     response = client.post(
         "/loan/quote",
-        headers=headers,
+        headers=auth_headers,
         json={"farmer_id": "FRM006"}
     )
     assert response.status_code == 200
@@ -61,17 +37,14 @@ def test_get_loan_quote_eligible(client: TestClient, db: Session):
     assert len(data["emi_plans"]) > 0
     assert data["crop_cycle_months"] == 5  # Wheat
 
-def test_get_loan_quote_ineligible(client: TestClient, db: Session):
-    user = create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_get_loan_quote_ineligible(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     # Create farmer with low score
     farmer = Farmer(
         farmer_id="FRM007",
         name="Ineligible Farmer",
         mobile="3333333333",
         land_area=2.0,
-        created_by=user.id
+        created_by=test_user.id
     )
     db.add(farmer)
     db.commit()
@@ -87,7 +60,7 @@ def test_get_loan_quote_ineligible(client: TestClient, db: Session):
     
     response = client.post(
         "/loan/quote",
-        headers=headers,
+        headers=auth_headers,
         json={"farmer_id": "FRM007"}
     )
     assert response.status_code == 200
@@ -95,23 +68,60 @@ def test_get_loan_quote_ineligible(client: TestClient, db: Session):
     assert data["eligible"] is False
     assert "not recommended" in data["remarks"].lower()
 
-def test_get_loan_quote_no_score(client: TestClient, db: Session):
-    user = create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_get_loan_quote_no_score(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     farmer = Farmer(
         farmer_id="FRM008",
         name="No Score Farmer",
         mobile="2222222222",
-        created_by=user.id
+        created_by=test_user.id
     )
     db.add(farmer)
     db.commit()
     
     response = client.post(
         "/loan/quote",
-        headers=headers,
+        headers=auth_headers,
         json={"farmer_id": "FRM008"}
     )
     assert response.status_code == 400
     assert "compute score first" in response.json()["detail"].lower()
+
+def test_get_loan_quote_batch(client: TestClient, db: Session, test_user: User, auth_headers: dict):
+    for farmer_id, mobile, score_value in [("FRM009", "1111111111", 75.0), ("FRM010", "1212121212", 45.0)]:
+        farmer = Farmer(
+            farmer_id=farmer_id,
+            name="Batch Farmer",
+            mobile=mobile,
+            land_area=3.0,
+            crop_type="cotton",
+            created_by=test_user.id
+        )
+        db.add(farmer)
+        db.commit()
+        
+        db.add(Score(
+            farmer_id=farmer.id,
+            score=score_value,
+            score_band="medium",
+            computed_at=datetime.utcnow()
+        ))
+        db.commit()
+    
+    quotes = [{"farmer_id": "FRM009"}, {"farmer_id": "FRM010", "requested_amount": 20000}]
+    response = client.post("/loan/quote/batch", headers=auth_headers, json={"quotes": quotes})
+    assert response.status_code == 200
+    data = response.json()
+    assert [quote["farmer_id"] for quote in data] == ["FRM009", "FRM010"]
+    
+    # Batch pricing matches the single-quote endpoint
+    for quote, batch_quote in zip(quotes, data):
+        single = client.post("/loan/quote", headers=auth_headers, json=quote)
+        assert single.json() == batch_quote
+    
+    response = client.post(
+        "/loan/quote/batch",
+        headers=auth_headers,
+        json={"quotes": [{"farmer_id": "FRM009"}, {"farmer_id": "FRM999"}]}
+    )
+    assert response.status_code == 404
+    assert "FRM999" in response.json()["detail"]
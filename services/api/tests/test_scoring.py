@@ -1,33 +1,15 @@
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from models import User, Farmer, Score
-from auth import get_password_hash
-from datetime import datetime
+from datetime import datetime, timedelta
+import os
+import billiard
+import routes.scoring
+import scoring_service
+from batch_jobs import run_batch_score
+from scoring_service import score_farmers, score_farmers_parallel, create_scoring_pool
 
-def create_test_user(db: Session, role: str = "agent") -> User:
-    user = User(
-        username=f"test{role}",
-        email=f"test{role}@example.com",
-        hashed_password=get_password_hash("password123"),
-        role=role
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
-
-def get_auth_headers(client: TestClient, username: str = "testagent"):
-    response = client.post(
-        "/auth/login",
-        json={"username": username, "password": "password123"}
-    )
-    token = response.json()["access_token"]
-    return {"Authorization": f"Bearer {token}"}
-
-def test_compute_score_success(client: TestClient, db: Session):
-    user = create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_compute_score_success(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     # Create farmer with consent
     farmer = Farmer(
         farmer_id="FRM003",
@@ -36,14 +18,14 @@ def test_compute_score_success(client: TestClient, db: Session):
         consent_given=True,
         land_area=2.5,
         crop_type="wheat",
-        created_by=user.id
+        created_by=test_user.id
     )
     db.add(farmer)
     db.commit()
     
     response = client.post(
         "/score",
-        headers=headers,
+        headers=auth_headers,
         json={"farmer_id": "FRM003"}
     )
     assert response.status_code == 200
@@ -54,49 +36,40 @@ def test_compute_score_success(client: TestClient, db: Session):
     assert len(data["drivers"]) > 0
     assert data["score"] >= 0 and data["score"] <= 100
 
-def test_compute_score_no_consent(client: TestClient, db: Session):
-    user = create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_compute_score_no_consent(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     # Create farmer without consent
     farmer = Farmer(
         farmer_id="FRM004",
         name="No Consent Farmer",
         mobile="6666666666",
         consent_given=False,
-        created_by=user.id
+        created_by=test_user.id
     )
     db.add(farmer)
     db.commit()
     
     response = client.post(
         "/score",
-        headers=headers,
+        headers=auth_headers,
         json={"farmer_id": "FRM004"}
     )
     assert response.status_code == 403
     assert "consent required" in response.json()["detail"]
 
-def test_compute_score_farmer_not_found(client: TestClient, db: Session):
-    create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_compute_score_farmer_not_found(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     response = client.post(
         "/score",
-        headers=headers,
+        headers=auth_headers,
         json={"farmer_id": "NONEXISTENT"}
     )
     assert response.status_code == 404
 
-def test_get_score_history(client: TestClient, db: Session):
-    user = create_test_user(db)
-    headers = get_auth_headers(client)
-    
+def test_get_score_history(client: TestClient, db: Session, test_user: User, auth_headers: dict):
     farmer = Farmer(
         farmer_id="FRM005",
         name="History Farmer",
         mobile="5555555555",
-        created_by=user.id
+        created_by=test_user.id
     )
     db.add(farmer)
     db.commit()
@@ -107,9 +80,161 @@ def test_get_score_history(client: TestClient, db: Session):
     db.add_all([s1, s2])
     db.commit()
     
-    response = client.get("/score/FRM005/history", headers=headers)
+    response = client.get("/score/FRM005/history", headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
     assert len(data["scores"]) == 2
     # Should be ordered by date desc (though we used same time, order might vary in test)
     assert data["farmer_id"] == "FRM005"
+
+def test_get_score_history_pagination(client: TestClient, db: Session, test_user: User, auth_headers: dict):
+    farmer = Farmer(
+        farmer_id="FRM006",
+        name="Paged Farmer",
+        mobile="6666666666",
+        created_by=test_user.id
+    )
+    db.add(farmer)
+    db.commit()
+    
+    start = datetime(2024, 1, 1)
+    db.add_all([
+        Score(farmer_id=farmer.id, score=50 + i, score_band="medium", computed_at=start + timedelta(days=i))
+        for i in range(5)
+    ])
+    db.commit()
+    
+    response = client.get("/score/FRM006/history?limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    first_page = response.json()["scores"]
+    assert [score["score"] for score in first_page] == [54, 53]
+    
+    response = client.get(
+        "/score/FRM006/history",
+        params={"limit": 2, "before": first_page[-1]["computed_at"]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert [score["score"] for score in response.json()["scores"]] == [52, 51]
+    
+    response = client.get("/score/FRM006/history?limit=1000", headers=auth_headers)
+    assert response.status_code == 422
+
+def test_get_score_history_tied_timestamps(client: TestClient, db: Session, test_user: User, auth_headers: dict):
+    farmer = Farmer(
+        farmer_id="FRM007",
+        name="Tied Farmer",
+        mobile="7777777777",
+        created_by=test_user.id
+    )
+    db.add(farmer)
+    db.commit()
+    
+    # Four scores from one batch share a timestamp; one is a day older
+    batch_time = datetime(2024, 3, 1, 12, 0)
+    db.add_all([
+        Score(farmer_id=farmer.id, score=60 + i, score_band="medium", computed_at=batch_time)
+        for i in range(4)
+    ] + [Score(farmer_id=farmer.id, score=40, score_band="low", computed_at=batch_time - timedelta(days=1))])
+    db.commit()
+    
+    seen = []
+    params = {"limit": 3}
+    while True:
+        response = client.get("/score/FRM007/history", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        page = response.json()["scores"]
+        if not page:
+            break
+        seen.extend(page)
+        params = {"limit": 3, "before": page[-1]["computed_at"], "before_id": page[-1]["id"]}
+    
+    assert sorted(score["score"] for score in seen) == [40, 60, 61, 62, 63]
+    assert len({score["id"] for score in seen}) == 5
+    
+    # A tz-aware cursor is compared in UTC: 17:30+05:30 is the batch time itself
+    response = client.get(
+        "/score/FRM007/history",
+        params={"before": "2024-03-01T17:30:00+05:30"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert [score["score"] for score in response.json()["scores"]] == [40]
+
+def test_batch_score(client: TestClient, db: Session, test_user: User, auth_headers: dict, monkeypatch):
+    # Run the worker's job inline instead of queueing it on Celery
+    def run_inline(job_id):
+        run_batch_score(db.get_bind(), job_id)
+    monkeypatch.setattr(routes.scoring, "dispatch_batch_score", run_inline)
+    
+    for farmer_id, mobile, consent in [("FRM011", "1313131313", True), ("FRM012", "1414141414", True), ("FRM013", "1515151515", False)]:
+        db.add(Farmer(
+            farmer_id=farmer_id,
+            name="Batch Farmer",
+            mobile=mobile,
+            consent_given=consent,
+            land_area=2.0,
+            crop_type="rice",
+            created_by=test_user.id
+        ))
+    db.commit()
+    
+    response = client.post(
+        "/score/batch",
+        headers=auth_headers,
+        json={"farmer_ids": ["FRM011", "FRM012", "FRM013", "FRM999"]}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "pending"
+    
+    assert db.query(Score).count() == 2
+    response = client.get(f"/jobs/{data['job_id']}", headers=auth_headers)
+    job = response.json()
+    assert job["status"] == "completed"
+    assert job["output_data"]["scored"] == ["FRM011", "FRM012"]
+    assert job["output_data"]["no_consent"] == ["FRM013"]
+    assert job["output_data"]["not_found"] == ["FRM999"]
+
+def _score_in_pool(farmer_data_list, results):
+    with create_scoring_pool(3) as pool:
+        results.put(score_farmers_parallel(pool, farmer_data_list, 3))
+
+def test_score_farmers_parallel_in_daemonic_process():
+    farmer_data_list = [
+        {'farmer_id': f"FRM{i:03d}", 'land_area': 0.5 + i * 0.05, 'crop_type': 'wheat', 'ndvi_mean': 0.3 + i * 0.002}
+        for i in range(200)
+    ]
+    
+    # Celery prefork workers are daemonic billiard processes; the pool must start from one
+    results = billiard.Queue()
+    parent = billiard.Process(target=_score_in_pool, args=(farmer_data_list, results), daemon=True)
+    parent.start()
+    parallel = results.get(timeout=60)
+    parent.join(timeout=60)
+    
+    assert parallel == score_farmers(farmer_data_list)
+
+def test_ml_model_loads_when_artifact_present():
+    # A failed import of the ML module silently falls back to deterministic scoring
+    assert os.path.exists(scoring_service.MODEL_PATH)
+    assert scoring_service.ML_AVAILABLE
+    assert scoring_service.get_scoring_model().model is not None
+
+def test_predict_batch_matches_predict():
+    model = scoring_service.get_scoring_model()
+    assert model.model is not None
+    
+    farmer_data_list = [
+        {
+            'farmer_id': f"FRM{i:03d}",
+            'land_area': 0.3 + i * 0.2,
+            'crop_type': ['rice', 'wheat', 'cotton', 'maize', 'millet'][i % 5],
+            'ndvi_mean': 0.15 + i * 0.015,
+            'past_kcc_defaults': i % 4,
+            'upi_txn_freq': i
+        }
+        for i in range(50)
+    ]
+    
+    assert model.predict_batch(farmer_data_list) == [model.predict(farmer_data) for farmer_data in farmer_data_list]
@@ -0,0 +1,17 @@
+from celery_app import compute_score_task, _cached_score
+
+def test_compute_score_task_cache_hit():
+    _cached_score.cache_clear()
+    farmer_data = {'farmer_id': "FRM021", 'land_area': 2.5, 'crop_type': 'wheat', 'ndvi_mean': 0.61}
+    
+    first = compute_score_task(farmer_data)
+    assert first['success']
+    
+    # Inputs within the quantization step share the cached entry
+    second = compute_score_task({**farmer_data, 'land_area': 2.50004})
+    assert second == first
+    assert _cached_score.cache_info().hits == 1
+    
+    # Mutating a returned result must not leak into the cache
+    first['drivers'][0]['feature'] = "mutated"
+    assert compute_score_task(farmer_data)['drivers'] == second['drivers']
@@ -1,6 +1,7 @@
 """
 Feature engineering utilities for Farmer Credit Score Engine
 """
+from dataclasses import dataclass
 import pandas as pd
 import numpy as np
 from typing import Dict, List
@@ -28,6 +29,71 @@ CROP_ENCODING = {
     'maize': 0.75
 }
 
+# Category codes for FarmerBatch.crop_type; code -1 (unknown crop) indexes the
+# trailing 0.7 fallback of CROP_ENCODING_TABLE
+CROP_NAMES = list(CROP_ENCODING.keys())
+CROP_ENCODING_TABLE = np.array(list(CROP_ENCODING.values()) + [0.7])
+
+@dataclass
+class FarmerBatch:
+    """
+    Column-per-feature (structure of arrays) view of many farmers
+    
+    Every attribute is a 1-D array with one entry per farmer. crop_type holds
+    int8 codes into CROP_NAMES, with -1 for unknown crops.
+    """
+    land_area: np.ndarray
+    crop_type: np.ndarray
+    last_year_yield_est: np.ndarray
+    ndvi_mean: np.ndarray
+    ndvi_trend: np.ndarray
+    rainfall_anomaly_3mo: np.ndarray
+    past_kcc_defaults: np.ndarray
+    upi_txn_freq: np.ndarray
+    market_price_volatility: np.ndarray
+    fpo_membership_flag: np.ndarray
+    distance_to_mandi_km: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.land_area)
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'FarmerBatch':
+        """
+        Build a batch from a farmer DataFrame in one pass over its columns
+        
+        Missing columns take the extract_features defaults.
+        
+        Args:
+            df: Farmer data with one row per farmer
+        
+        Returns:
+            FarmerBatch with float64 feature columns
+        """
+        def column(name: str, default: float) -> np.ndarray:
+            if name not in df:
+                return np.full(len(df), default, dtype=np.float64)
+            return df[name].to_numpy(dtype=np.float64)
+        
+        if 'crop_type' in df:
+            crop_codes = pd.Categorical(df['crop_type'], categories=CROP_NAMES).codes.astype(np.int8)
+        else:
+            crop_codes = np.full(len(df), CROP_NAMES.index('rice'), dtype=np.int8)
+        
+        return cls(
+            land_area=column('land_area', 2.0),
+            crop_type=crop_codes,
+            last_year_yield_est=column('last_year_yield_est', 3.0),
+            ndvi_mean=column('ndvi_mean', 0.5),
+            ndvi_trend=column('ndvi_trend', 0.0),
+            rainfall_anomaly_3mo=column('rainfall_anomaly_3mo', 0.0),
+            past_kcc_defaults=column('past_kcc_defaults', 0),
+            upi_txn_freq=column('upi_txn_freq', 10),
+            market_price_volatility=column('market_price_volatility', 15),
+            fpo_membership_flag=column('fpo_membership_flag', 0),
+            distance_to_mandi_km=column('distance_to_mandi_km', 20)
+        )
+
 def normalize_feature(value: float, min_val: float, max_val: float, inverse: bool = False) -> float:
     """
     Normalize a feature value to 0-1 range
@@ -126,6 +192,59 @@ def extract_features(farmer_data: Dict) -> Dict[str, float]:
     
     return features
 
+def normalize_features(
+    values: np.ndarray,
+    min_val: float,
+    max_val: float,
+    inverse: bool = False
+) -> np.ndarray:
+    """
+    Vectorized normalize_feature over an array of raw values
+    
+    Args:
+        values: Raw feature values
+        min_val: Minimum expected value
+        max_val: Maximum expected value
+        inverse: If True, higher values result in lower scores
+    
+    Returns:
+        Normalized values between 0 and 1
+    """
+    normalized = np.clip((values - min_val) / (max_val - min_val), 0.0, 1.0)
+    return 1.0 - normalized if inverse else normalized
+
+def extract_features_batch(batch: FarmerBatch) -> np.ndarray:
+    """
+    Extract and normalize features for every farmer in a batch
+    
+    Column-wise equivalent of extract_features: each feature is computed on
+    its contiguous column and written into one preallocated matrix.
+    
+    Args:
+        batch: Farmer columns, e.g. from FarmerBatch.from_frame
+    
+    Returns:
+        (N, 11) C-ordered matrix of normalized features in get_feature_names() order
+    """
+    features = np.empty((len(batch), 11), dtype=np.float64)
+    yield_per_hectare = np.divide(
+        batch.last_year_yield_est, batch.land_area,
+        out=np.zeros(len(batch)), where=batch.land_area > 0
+    )
+    
+    features[:, 0] = normalize_features(batch.land_area, 0.5, 10.0)
+    features[:, 1] = CROP_ENCODING_TABLE[batch.crop_type]
+    features[:, 2] = normalize_features(yield_per_hectare, 1.5, 5.0)
+    features[:, 3] = normalize_features(batch.ndvi_mean, 0.2, 0.9)
+    features[:, 4] = normalize_features(batch.ndvi_trend, -0.15, 0.15)
+    features[:, 5] = 1.0 - normalize_features(np.abs(batch.rainfall_anomaly_3mo), 0, 50)
+    features[:, 6] = normalize_features(batch.past_kcc_defaults, 0, 3, inverse=True)
+    features[:, 7] = normalize_features(batch.upi_txn_freq, 0, 50)
+    features[:, 8] = normalize_features(batch.market_price_volatility, 5, 30, inverse=True)
+    features[:, 9] = batch.fpo_membership_flag
+    features[:, 10] = normalize_features(batch.distance_to_mandi_km, 2, 50, inverse=True)
+    return features
+
 def get_feature_names() -> List[str]:
     """Get list of all feature names"""
     return list(FEATURE_WEIGHTS.keys())
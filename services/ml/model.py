@@ -9,15 +9,24 @@ import warnings
 warnings.filterwarnings('ignore')
 
 try:
-    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.ensemble import HistGradientBoostingRegressor
     import shap
     ML_AVAILABLE = True
 except ImportError:
     ML_AVAILABLE = False
     print("Warning: scikit-learn or shap not available. Using deterministic scoring only.")
 
-from .features import extract_features, get_feature_names, get_feature_descriptions
-from .scoring import compute_deterministic_score
+from features import get_feature_names, get_feature_descriptions
+from scoring import compute_deterministic_score, compute_deterministic_scores
+from scoring_fast import extract_feature_row, extract_feature_rows
+
+def cuda_available() -> bool:
+    """Check for a usable CUDA device (cupy is optional)"""
+    try:
+        import cupy
+        return cupy.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
 
 class FarmerCreditModel:
     """
@@ -39,14 +48,45 @@ class FarmerCreditModel:
         
         if model_path and os.path.exists(model_path) and ML_AVAILABLE:
             try:
-                self.model = joblib.load(model_path)
+                # Memory-map the tree arrays read-only so worker processes share them via the page cache
+                self.model = joblib.load(model_path, mmap_mode='r')
                 # Initialize SHAP explainer
-                self.explainer = shap.TreeExplainer(self.model)
+                self.explainer = self._build_explainer()
+                self._warm_up()
                 print(f"✓ Loaded ML model from {model_path}")
             except Exception as e:
                 print(f"Warning: Could not load model from {model_path}: {e}")
                 print("Falling back to deterministic scoring")
     
+    def _build_explainer(self):
+        """
+        Build the SHAP tree explainer, on the GPU when CUDA is available
+        
+        Returns:
+            GPUTreeExplainer if a CUDA device and a CUDA-enabled shap build
+            are present, otherwise TreeExplainer
+        """
+        if cuda_available():
+            try:
+                explainer = shap.GPUTreeExplainer(self.model)
+                print("✓ Using GPU SHAP explainer")
+                return explainer
+            except Exception as e:
+                print(f"Warning: GPU SHAP explainer unavailable: {e}")
+        
+        return shap.TreeExplainer(self.model)
+    
+    def _warm_up(self) -> None:
+        """
+        Run one prediction and explanation on a neutral row
+        
+        Moves the explainer's one-time tree preparation (and GPU transfer)
+        into model load instead of the first request.
+        """
+        neutral_row = np.full((1, len(self.feature_names)), 0.5, dtype=np.float32)
+        self.model.predict(neutral_row)
+        self.explainer.shap_values(neutral_row)
+    
     def predict(self, farmer_data: Dict) -> Tuple[float, List[Dict]]:
         """
         Predict credit score for a farmer
@@ -61,34 +101,75 @@ class FarmerCreditModel:
             # Use deterministic scoring as fallback
             return compute_deterministic_score(farmer_data)
         
+        feature_row = None
+        
         try:
-            # Extract features
-            features = extract_features(farmer_data)
-            feature_vector = np.array([[features[name] for name in self.feature_names]])
+            # Normalize straight into a feature-ordered array; no per-feature dict on the hot path
+            feature_row = extract_feature_row(farmer_data)
+            feature_vector = np.ascontiguousarray(feature_row, dtype=np.float32).reshape(1, -1)
             
             # Predict score
             score_normalized = self.model.predict(feature_vector)[0]
             score = max(0.0, min(100.0, score_normalized * 100))
             
             # Generate SHAP explanations
-            drivers = self._generate_shap_drivers(feature_vector, farmer_data)
+            drivers = self._generate_shap_drivers(feature_vector, feature_row, farmer_data)
             
             return round(score, 1), drivers
-            
+        
         except Exception as e:
             print(f"Warning: ML prediction failed: {e}. Using deterministic scoring.")
-            return compute_deterministic_score(farmer_data)
+            return compute_deterministic_score(farmer_data, feature_row)
+    
+    def predict_batch(self, farmer_data_list: List[Dict]) -> List[Tuple[float, List[Dict]]]:
+        """
+        Predict credit scores for many farmers with a single model call
+        
+        Args:
+            farmer_data_list: List of farmer information dictionaries
+        
+        Returns:
+            List of (score, drivers) tuples in input order
+        """
+        if self.model is None or not ML_AVAILABLE:
+            return compute_deterministic_scores(farmer_data_list)
+        
+        feature_rows = None
+        
+        try:
+            # Same compiled per-farmer normalization as predict, stacked without per-feature dicts
+            feature_rows = extract_feature_rows(farmer_data_list)
+            
+            # One row per farmer, one column per feature; row-major float32 as the trees read it
+            feature_matrix = np.ascontiguousarray(feature_rows, dtype=np.float32)
+            
+            # Predict all scores at once
+            scores = np.clip(self.model.predict(feature_matrix) * 100, 0.0, 100.0)
+            
+            # Explain all rows with one SHAP call
+            drivers_list = self._generate_shap_drivers_batch(feature_matrix, farmer_data_list, feature_rows)
+            
+            return [
+                (round(float(score), 1), drivers)
+                for score, drivers in zip(scores, drivers_list)
+            ]
+        
+        except Exception as e:
+            print(f"Warning: ML batch prediction failed: {e}. Using deterministic scoring.")
+            return compute_deterministic_scores(farmer_data_list, feature_rows)
     
     def _generate_shap_drivers(
         self,
         feature_vector: np.ndarray,
+        feature_row: np.ndarray,
         farmer_data: Dict
     ) -> List[Dict]:
         """
         Generate top 3 drivers using SHAP values
         
         Args:
-            feature_vector: Normalized feature vector
+            feature_vector: (1, F) float32 model input
+            feature_row: Float64 extract_feature_row output, reused by the deterministic fallback
             farmer_data: Raw farmer data
         
         Returns:
@@ -96,52 +177,101 @@ class FarmerCreditModel:
         """
         if self.explainer is None:
             # Fallback to deterministic drivers
-            _, drivers = compute_deterministic_score(farmer_data)
+            _, drivers = compute_deterministic_score(farmer_data, feature_row)
             return drivers
         
         try:
             # Compute SHAP values
             shap_values = self.explainer.shap_values(feature_vector)
-            
-            # Get feature impacts
-            impacts = []
-            for i, feature_name in enumerate(self.feature_names):
-                shap_value = shap_values[0][i] * 100  # Scale to 0-100
-                impacts.append({
-                    'feature': feature_name,
-                    'impact': shap_value,
-                    'feature_value': feature_vector[0][i]
-                })
-            
-            # Sort by absolute impact
-            impacts.sort(key=lambda x: abs(x['impact']), reverse=True)
-            
-            # Generate top 3 drivers with explanations
-            drivers = []
-            for impact_data in impacts[:3]:
-                feature = impact_data['feature']
-                impact = impact_data['impact']
-                
-                explanation = self._generate_shap_explanation(
-                    feature,
-                    impact,
-                    impact_data['feature_value'],
-                    farmer_data
-                )
-                
-                drivers.append({
-                    'feature': self.feature_descriptions.get(feature, feature),
-                    'impact': round(impact, 1),
-                    'explanation': explanation
-                })
-            
-            return drivers
-            
+            return self._drivers_from_shap(shap_values[0], feature_vector[0], farmer_data)
+        
         except Exception as e:
             print(f"Warning: SHAP explanation failed: {e}")
-            _, drivers = compute_deterministic_score(farmer_data)
+            _, drivers = compute_deterministic_score(farmer_data, feature_row)
             return drivers
     
+    def _generate_shap_drivers_batch(
+        self,
+        feature_matrix: np.ndarray,
+        farmer_data_list: List[Dict],
+        feature_rows: np.ndarray
+    ) -> List[List[Dict]]:
+        """
+        Generate top 3 drivers for many farmers from one SHAP call
+        
+        Args:
+            feature_matrix: (N, F) normalized feature matrix
+            farmer_data_list: Raw farmer data per row
+            feature_rows: Float64 (N, F) extract_feature_rows output, reused by the deterministic fallback
+        
+        Returns:
+            List of driver lists in row order
+        """
+        if self.explainer is None:
+            return [drivers for _, drivers in compute_deterministic_scores(farmer_data_list, feature_rows)]
+        
+        try:
+            shap_values = self.explainer.shap_values(feature_matrix)
+            return [
+                self._drivers_from_shap(shap_row, feature_row, farmer_data)
+                for shap_row, feature_row, farmer_data in zip(shap_values, feature_matrix, farmer_data_list)
+            ]
+        
+        except Exception as e:
+            print(f"Warning: SHAP explanation failed: {e}")
+            return [drivers for _, drivers in compute_deterministic_scores(farmer_data_list, feature_rows)]
+    
+    def _drivers_from_shap(
+        self,
+        shap_row: np.ndarray,
+        feature_row: np.ndarray,
+        farmer_data: Dict
+    ) -> List[Dict]:
+        """
+        Turn one row of SHAP values into the top 3 drivers
+        
+        Args:
+            shap_row: SHAP values for one farmer, in feature order
+            feature_row: Normalized feature values for the same farmer
+            farmer_data: Raw farmer data
+        
+        Returns:
+            List of driver dictionaries
+        """
+        # Get feature impacts
+        impacts = []
+        for i, feature_name in enumerate(self.feature_names):
+            shap_value = shap_row[i] * 100  # Scale to 0-100
+            impacts.append({
+                'feature': feature_name,
+                'impact': shap_value,
+                'feature_value': feature_row[i]
+            })
+        
+        # Sort by absolute impact
+        impacts.sort(key=lambda x: abs(x['impact']), reverse=True)
+        
+        # Generate top 3 drivers with explanations
+        drivers = []
+        for impact_data in impacts[:3]:
+            feature = impact_data['feature']
+            impact = impact_data['impact']
+            
+            explanation = self._generate_shap_explanation(
+                feature,
+                impact,
+                impact_data['feature_value'],
+                farmer_data
+            )
+            
+            drivers.append({
+                'feature': self.feature_descriptions.get(feature, feature),
+                'impact': round(impact, 1),
+                'explanation': explanation
+            })
+        
+        return drivers
+    
     def _generate_shap_explanation(
         self,
         feature: str,
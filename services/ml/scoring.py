@@ -2,94 +2,139 @@
 Deterministic scoring function for Farmer Credit Score Engine
 Provides transparent, rule-based scoring as fallback to ML model
 """
-from typing import Dict, List, Tuple
-from features import extract_features, FEATURE_WEIGHTS, get_feature_descriptions
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from features import FEATURE_WEIGHTS, get_feature_descriptions
+from scoring_fast import extract_feature_row, extract_feature_rows
 
-def compute_deterministic_score(farmer_data: Dict) -> Tuple[float, List[Dict]]:
+# Feature order and per-point weights (weight * 100), precomputed once at import
+FEATURE_ORDER = list(FEATURE_WEIGHTS)
+SCORE_WEIGHTS = np.array(list(FEATURE_WEIGHTS.values()), dtype=np.float64) * 100
+SCORE_BIAS = 0.0
+
+# Contribution of each feature at a neutral normalized value of 0.5
+NEUTRAL_CONTRIBUTIONS = 0.5 * SCORE_WEIGHTS
+FEATURE_DESCRIPTIONS = get_feature_descriptions()
+
+def compute_deterministic_score(
+    farmer_data: Dict,
+    feature_vector: Optional[np.ndarray] = None
+) -> Tuple[float, List[Dict]]:
     """
     Compute farmer credit score using deterministic weighted sum
     
     Args:
         farmer_data: Dictionary containing farmer information
+        feature_vector: extract_feature_row output for farmer_data, if already computed
     
     Returns:
         Tuple of (score, drivers) where:
         - score: Credit score from 0 to 100
         - drivers: List of top 3 feature impacts with explanations
     """
-    # Extract and normalize features
-    features = extract_features(farmer_data)
-    
-    # Compute weighted score
-    weighted_contributions = {}
-    total_score = 0.0
+    # Extract and normalize features (compiled single-row path unless already extracted)
+    if feature_vector is None:
+        feature_vector = extract_feature_row(farmer_data)
+    feature_matrix = feature_vector[np.newaxis, :]
     
-    for feature_name, weight in FEATURE_WEIGHTS.items():
-        feature_value = features.get(feature_name, 0.5)
-        contribution = feature_value * weight * 100
-        weighted_contributions[feature_name] = contribution
-        total_score += contribution
-    
-    # Ensure score is in valid range
-    score = max(0.0, min(100.0, total_score))
+    # Compute weighted score, clamped to the valid range
+    score = float(weighted_scores(feature_matrix)[0])
     
     # Generate drivers (top 3 features by absolute deviation from neutral)
-    drivers = generate_drivers(features, weighted_contributions, farmer_data)
+    impacts, top_features = driver_impacts(feature_matrix)
+    drivers = generate_drivers(feature_vector.tolist(), impacts[0], top_features[0], farmer_data)
     
     return round(score, 1), drivers
 
+def weighted_scores(feature_matrix: np.ndarray) -> np.ndarray:
+    """
+    Compute deterministic scores for a matrix of normalized features
+    
+    Both the single and batch paths go through this one matrix-vector
+    product, so their results match exactly.
+    
+    Args:
+        feature_matrix: (N, F) normalized features in FEATURE_ORDER
+    
+    Returns:
+        (N,) scores clamped to 0-100 (unrounded)
+    """
+    return np.clip(feature_matrix @ SCORE_WEIGHTS + SCORE_BIAS, 0.0, 100.0)
+
+def compute_deterministic_scores(
+    farmer_data_list: List[Dict],
+    feature_matrix: Optional[np.ndarray] = None
+) -> List[Tuple[float, List[Dict]]]:
+    """
+    Compute deterministic scores for many farmers at once
+    
+    Args:
+        farmer_data_list: List of farmer information dictionaries
+        feature_matrix: extract_feature_rows output for farmer_data_list, if already computed
+    
+    Returns:
+        List of (score, drivers) tuples in input order
+    """
+    if feature_matrix is None:
+        feature_matrix = extract_feature_rows(farmer_data_list)
+    
+    scores = weighted_scores(feature_matrix)
+    impacts, top_features = driver_impacts(feature_matrix)
+    
+    return [
+        (
+            round(float(score), 1),
+            generate_drivers(feature_row, row_impacts, row_top_features, farmer_data)
+        )
+        for score, feature_row, row_impacts, row_top_features, farmer_data in zip(
+            scores, feature_matrix.tolist(), impacts, top_features, farmer_data_list
+        )
+    ]
+
+def driver_impacts(feature_matrix: np.ndarray) -> Tuple[List[List[float]], List[List[int]]]:
+    """
+    Score impacts versus neutral and the top 3 features for each row
+    
+    Args:
+        feature_matrix: (N, F) normalized features in FEATURE_ORDER
+    
+    Returns:
+        Tuple of (impacts, top_features) where:
+        - impacts: Per-row impacts rounded to 1 decimal
+        - top_features: Per-row indices of the 3 largest absolute impacts
+    """
+    impacts = np.round(feature_matrix * SCORE_WEIGHTS - NEUTRAL_CONTRIBUTIONS, 1)
+    # Stable sort keeps feature order among equal impacts; argpartition would not
+    top_features = np.argsort(-np.abs(impacts), axis=1, kind='stable')[:, :3]
+    return impacts.tolist(), top_features.tolist()
+
 def generate_drivers(
-    features: Dict[str, float],
-    contributions: Dict[str, float],
+    feature_values: List[float],
+    impacts: List[float],
+    top_features: List[int],
     farmer_data: Dict
 ) -> List[Dict]:
     """
     Generate top 3 score drivers with human-readable explanations
     
     Args:
-        features: Normalized feature values
-        contributions: Weighted contributions to score
+        feature_values: Normalized feature values in FEATURE_ORDER
+        impacts: Impacts versus neutral in FEATURE_ORDER (from driver_impacts)
+        top_features: Indices of the top 3 features (from driver_impacts)
         farmer_data: Raw farmer data for context
     
     Returns:
         List of driver dictionaries with feature, impact, and explanation
     """
-    feature_descriptions = get_feature_descriptions()
-    
-    # Calculate impact as deviation from neutral (50% contribution)
-    impacts = []
-    for feature_name, contribution in contributions.items():
-        weight = FEATURE_WEIGHTS[feature_name]
-        neutral_contribution = 0.5 * weight * 100
-        impact = contribution - neutral_contribution
-        
-        impacts.append({
-            'feature': feature_name,
-            'impact': round(impact, 1),
-            'contribution': round(contribution, 1),
-            'normalized_value': features[feature_name]
-        })
-    
-    # Sort by absolute impact
-    impacts.sort(key=lambda x: abs(x['impact']), reverse=True)
-    
-    # Get top 3 and add explanations
     drivers = []
-    for impact_data in impacts[:3]:
-        feature = impact_data['feature']
-        impact = impact_data['impact']
-        
-        explanation = generate_explanation(
-            feature,
-            impact,
-            impact_data['normalized_value'],
-            farmer_data
-        )
+    for index in top_features:
+        feature = FEATURE_ORDER[index]
+        impact = impacts[index]
         
         drivers.append({
-            'feature': feature_descriptions.get(feature, feature),
+            'feature': FEATURE_DESCRIPTIONS.get(feature, feature),
             'impact': impact,
-            'explanation': explanation
+            'explanation': generate_explanation(feature, impact, feature_values[index], farmer_data)
         })
     
     return drivers
@@ -0,0 +1,95 @@
+"""
+Compiled single-farmer feature normalization for deterministic scoring
+"""
+from typing import Dict, List
+import numpy as np
+from features import CROP_ENCODING
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+@njit(cache=True)
+def normalize(value: float, min_val: float, max_val: float) -> float:
+    """Scalar normalize_feature without the inverse flag"""
+    return max(0.0, min(1.0, (value - min_val) / (max_val - min_val)))
+
+@njit(cache=True)
+def feature_row(
+    land_area: float,
+    crop_encoding: float,
+    yield_est: float,
+    ndvi_mean: float,
+    ndvi_trend: float,
+    rainfall_anomaly: float,
+    defaults: float,
+    upi_txn_freq: float,
+    price_volatility: float,
+    fpo_membership: float,
+    distance_to_mandi: float
+) -> np.ndarray:
+    """
+    Normalize one farmer's raw inputs in a single compiled pass
+    
+    Same arithmetic as extract_features, so the values match it exactly.
+    
+    Returns:
+        (11,) normalized features in FEATURE_WEIGHTS order
+    """
+    yield_per_hectare = yield_est / land_area if land_area > 0 else 0.0
+    
+    row = np.empty(11)
+    row[0] = normalize(land_area, 0.5, 10.0)
+    row[1] = crop_encoding
+    row[2] = normalize(yield_per_hectare, 1.5, 5.0)
+    row[3] = normalize(ndvi_mean, 0.2, 0.9)
+    row[4] = normalize(ndvi_trend, -0.15, 0.15)
+    row[5] = 1.0 - normalize(abs(rainfall_anomaly), 0.0, 50.0)
+    row[6] = 1.0 - normalize(defaults, 0.0, 3.0)
+    row[7] = normalize(upi_txn_freq, 0.0, 50.0)
+    row[8] = 1.0 - normalize(price_volatility, 5.0, 30.0)
+    row[9] = fpo_membership
+    row[10] = 1.0 - normalize(distance_to_mandi, 2.0, 50.0)
+    return row
+
+def extract_feature_row(farmer_data: Dict) -> np.ndarray:
+    """
+    Dict front end for feature_row, with the extract_features defaults
+    
+    Args:
+        farmer_data: Dictionary containing farmer information
+    
+    Returns:
+        (11,) normalized features in FEATURE_WEIGHTS order
+    """
+    return feature_row(
+        float(farmer_data.get('land_area', 2.0)),
+        CROP_ENCODING.get(farmer_data.get('crop_type', 'rice'), 0.7),
+        float(farmer_data.get('last_year_yield_est', 3.0)),
+        float(farmer_data.get('ndvi_mean', 0.5)),
+        float(farmer_data.get('ndvi_trend', 0.0)),
+        float(farmer_data.get('rainfall_anomaly_3mo', 0.0)),
+        float(farmer_data.get('past_kcc_defaults', 0)),
+        float(farmer_data.get('upi_txn_freq', 10)),
+        float(farmer_data.get('market_price_volatility', 15)),
+        float(farmer_data.get('fpo_membership_flag', 0)),
+        float(farmer_data.get('distance_to_mandi_km', 20))
+    )
+
+def extract_feature_rows(farmer_data_list: List[Dict]) -> np.ndarray:
+    """
+    extract_feature_row for many farmers, stacked into one matrix
+    
+    Args:
+        farmer_data_list: List of farmer information dictionaries
+    
+    Returns:
+        (N, 11) normalized features in FEATURE_WEIGHTS order
+    """
+    feature_rows = np.empty((len(farmer_data_list), 11))
+    for i, farmer_data in enumerate(farmer_data_list):
+        feature_rows[i] = extract_feature_row(farmer_data)
+    return feature_rows
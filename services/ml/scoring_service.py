@@ -0,0 +1,200 @@
+"""
+Score computation shared by the API routes and the Celery worker
+
+Configured from the environment (MODEL_PATH, USE_ML_MODEL) so that both
+services can import it without each other's settings.
+"""
+from functools import lru_cache
+from typing import List, Tuple
+import logging
+import math
+import os
+import numpy as np
+from billiard.pool import Pool
+from threadpoolctl import threadpool_limits
+
+from scoring import compute_deterministic_score, compute_deterministic_scores
+
+logger = logging.getLogger(__name__)
+
+try:
+    from model import get_model
+    ML_AVAILABLE = True
+except ImportError:
+    ML_AVAILABLE = False
+    logger.warning("ML module not available")
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the batch kernel runs as plain NumPy
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Trained model artifact; defaults to the one shipped next to this module
+MODEL_PATH = os.getenv('MODEL_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model.joblib'))
+USE_ML_MODEL = os.getenv('USE_ML_MODEL', 'true').lower() in ('1', 'true', 'yes')
+
+# Smallest slice of a batch worth shipping to another process
+MIN_SCORE_CHUNK_SIZE = 64
+
+# Score band names indexed by score_band_codes output
+SCORE_BANDS = np.array(["low", "medium", "high"])
+
+def get_score_band(score: float) -> str:
+    """Determine score band from score value"""
+    if score < 40:
+        return "low"
+    elif score < 70:
+        return "medium"
+    else:
+        return "high"
+
+@njit(cache=True)
+def score_band_codes(scores: np.ndarray) -> np.ndarray:
+    """Band codes (0=low, 1=medium, 2=high) for an array of scores"""
+    # Branchless: each threshold passed adds one band
+    return (scores >= 40).astype(np.int8) + (scores >= 70).astype(np.int8)
+
+def get_score_bands(scores: np.ndarray) -> List[str]:
+    """Vectorized get_score_band for an array of scores"""
+    return SCORE_BANDS[score_band_codes(scores)].tolist()
+
+@lru_cache(maxsize=1)
+def get_scoring_model():
+    """Load the scoring model once per process"""
+    return get_model(MODEL_PATH if os.path.exists(MODEL_PATH) else None)
+
+def init_scoring_process() -> None:
+    """
+    Pool initializer: load the model once per child process
+    
+    Native thread pools are capped at one thread so that a pool with one
+    process per core does not oversubscribe the CPUs.
+    """
+    threadpool_limits(1)
+    if ML_AVAILABLE and USE_ML_MODEL:
+        get_scoring_model()
+
+def create_scoring_pool(processes: int) -> Pool:
+    """
+    Process pool for score_farmers_parallel
+    
+    Uses billiard, Celery's fork of multiprocessing: Celery's prefork workers
+    are daemonic, and the standard library refuses to start child processes
+    from a daemonic process.
+    
+    Args:
+        processes: Number of pool processes
+    
+    Returns:
+        Pool whose processes ran init_scoring_process
+    """
+    return Pool(processes=processes, initializer=init_scoring_process)
+
+def build_farmer_data(farmer) -> dict:
+    """
+    Assemble model inputs for a farmer
+    
+    Args:
+        farmer: Farmer row, or any row with farmer_id, land_area and crop_type
+    
+    Returns:
+        Farmer data dictionary for scoring
+    """
+    return {
+        'farmer_id': farmer.farmer_id,
+        'land_area': farmer.land_area or 2.0,
+        'crop_type': farmer.crop_type or 'rice',
+        'last_year_yield_est': 3.0,  # Default, should come from Farm model
+        'ndvi_mean': 0.6,  # Default, should come from satellite data
+        'ndvi_trend': 0.05,
+        'rainfall_anomaly_3mo': 0.0,
+        'past_kcc_defaults': 0,
+        'upi_txn_freq': 15,
+        'market_price_volatility': 15.0,
+        'fpo_membership_flag': 0,
+        'distance_to_mandi_km': 20.0
+    }
+
+def score_farmer(farmer_data: dict) -> Tuple[float, list, str]:
+    """
+    Score one farmer using ML model or deterministic fallback
+    
+    Args:
+        farmer_data: Farmer data dictionary from build_farmer_data
+    
+    Returns:
+        Tuple of (score, drivers, model_type)
+    """
+    try:
+        if ML_AVAILABLE and USE_ML_MODEL:
+            model = get_scoring_model()
+            score_value, drivers_data = model.predict(farmer_data)
+            model_type = "ml" if model.model is not None else "deterministic"
+        else:
+            score_value, drivers_data = compute_deterministic_score(farmer_data)
+            model_type = "deterministic"
+    except Exception:
+        logger.exception("Scoring error")
+        # Fallback to deterministic
+        score_value, drivers_data = compute_deterministic_score(farmer_data)
+        model_type = "deterministic"
+    
+    return score_value, drivers_data, model_type
+
+def score_farmers(farmer_data_list: List[dict]) -> Tuple[list, str]:
+    """
+    Score many farmers with one model call, or the deterministic fallback
+    
+    Args:
+        farmer_data_list: Farmer data dictionaries from build_farmer_data
+    
+    Returns:
+        Tuple of ((score, drivers) per farmer, model_type)
+    """
+    try:
+        if ML_AVAILABLE and USE_ML_MODEL:
+            model = get_scoring_model()
+            results = model.predict_batch(farmer_data_list)
+            model_type = "ml" if model.model is not None else "deterministic"
+        else:
+            results = compute_deterministic_scores(farmer_data_list)
+            model_type = "deterministic"
+    except Exception:
+        logger.exception("Batch scoring error")
+        # Fallback to deterministic
+        results = compute_deterministic_scores(farmer_data_list)
+        model_type = "deterministic"
+    
+    return results, model_type
+
+def score_farmers_parallel(pool: Pool, farmer_data_list: List[dict], workers: int) -> Tuple[list, str]:
+    """
+    Split score_farmers across a process pool, one chunk per worker
+    
+    Args:
+        pool: Pool from create_scoring_pool
+        farmer_data_list: Farmer data dictionaries from build_farmer_data
+        workers: Number of processes in the pool
+    
+    Returns:
+        Tuple of ((score, drivers) per farmer, model_type)
+    """
+    chunk_size = max(MIN_SCORE_CHUNK_SIZE, math.ceil(len(farmer_data_list) / workers))
+    if len(farmer_data_list) <= chunk_size:
+        return score_farmers(farmer_data_list)
+    
+    chunks = [
+        farmer_data_list[start:start + chunk_size]
+        for start in range(0, len(farmer_data_list), chunk_size)
+    ]
+    results = []
+    model_types = set()
+    for chunk_results, chunk_model_type in pool.map(score_farmers, chunks):
+        results.extend(chunk_results)
+        model_types.add(chunk_model_type)
+    
+    # A chunk that fell back taints the whole batch
+    model_type = "ml" if model_types == {"ml"} else "deterministic"
+    return results, model_type
@@ -2,19 +2,22 @@
 Mock Agri Stack API Service
 Simulates government Agri Stack endpoints for development/testing
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from fastapi.responses import ORJSONResponse
+from typing import List, Dict, Any, Optional, TypedDict
 from datetime import datetime, timedelta
+import itertools
+import numpy as np
 import pandas as pd
+import orjson
 import os
-import random
 
 app = FastAPI(
     title="Mock Agri Stack API",
     version="1.0.0",
-    description="Simulated Agri Stack endpoints for testing"
+    description="Simulated Agri Stack endpoints for testing",
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -29,10 +32,35 @@ app.add_middleware(
 # Load data
 DATA_DIR = os.getenv("DATA_DIR", "/app/data")
 
+# Low-cardinality string columns held as categoricals
+CATEGORICAL_COLUMNS = {
+    'farmers': ['crop_type', 'state', 'district', 'village'],
+    'satellite': ['land_id', 'farmer_id'],
+    'weather': ['geo_key', 'state']
+}
+
+# Farmer columns the lookup table needs; aadhar is optional and served as null when absent
+FARMER_COLUMNS = [
+    'farmer_id', 'name', 'mobile', 'state', 'district', 'village', 'land_area', 'crop_type'
+]
+
+def load_dataset(name: str) -> pd.DataFrame:
+    """Load <name>.parquet from DATA_DIR, falling back to <name>.csv"""
+    parquet_path = os.path.join(DATA_DIR, f"{name}.parquet")
+    if os.path.exists(parquet_path):
+        df = pd.read_parquet(parquet_path)
+    else:
+        # Keep identifiers as text; '+91...' would otherwise parse as integers
+        df = pd.read_csv(os.path.join(DATA_DIR, f"{name}.csv"), dtype={'mobile': str, 'aadhar': str})
+    return df.astype({col: 'category' for col in CATEGORICAL_COLUMNS[name] if col in df})
+
 try:
-    farmers_df = pd.read_csv(os.path.join(DATA_DIR, "farmers.csv"))
-    satellite_df = pd.read_csv(os.path.join(DATA_DIR, "satellite.csv"))
-    weather_df = pd.read_csv(os.path.join(DATA_DIR, "weather.csv"))
+    farmers_df = load_dataset("farmers")
+    missing_columns = [col for col in FARMER_COLUMNS if col not in farmers_df]
+    if missing_columns:
+        raise ValueError(f"farmers data is missing columns: {', '.join(missing_columns)}")
+    satellite_df = load_dataset("satellite")
+    weather_df = load_dataset("weather")
     print(f"✓ Loaded {len(farmers_df)} farmers, {len(satellite_df)} satellite records, {len(weather_df)} weather records")
 except Exception as e:
     print(f"Warning: Could not load data files: {e}")
@@ -40,15 +68,84 @@ except Exception as e:
     satellite_df = pd.DataFrame()
     weather_df = pd.DataFrame()
 
-# Response models
-class LandParcel(BaseModel):
+def summarize_weather(records: pd.DataFrame) -> tuple:
+    """(latitude, longitude, rainfall_mm, avg_temperature, humidity) over the latest 7 readings"""
+    recent = records.tail(7)
+    return (
+        float(recent.iloc[0]['latitude']),
+        float(recent.iloc[0]['longitude']),
+        float(round(recent['rainfall_mm'].sum(), 1)),
+        float(round(recent['temperature_max'].mean(), 1)),
+        float(round(recent['humidity'].mean(), 1))
+    )
+
+# Lookup tables built once, so requests do a dict lookup on native Python
+# values instead of touching the frames
+FARMERS = (
+    {
+        row.farmer_id: {
+            'name': row.name,
+            'mobile': row.mobile,
+            'aadhar': getattr(row, 'aadhar', None),
+            'state': row.state,
+            'district': row.district,
+            'village': row.village,
+            'land_area': float(row.land_area),
+            'crop_type': row.crop_type
+        }
+        for row in farmers_df.itertuples(index=False)
+    }
+    if not farmers_df.empty else {}
+)
+# Satellite responses never change, so each land's JSON body is serialized once
+SAT_CACHE = (
+    {
+        land_id: orjson.dumps({
+            "land_id": land_id,
+            "readings": readings[['date', 'ndvi', 'cloud_cover']].to_dict(orient='records')
+        })
+        for land_id, readings in satellite_df.groupby('land_id', sort=False, observed=True)
+    }
+    if not satellite_df.empty else {}
+)
+WEATHER_SUMMARIES = (
+    {
+        geo_key: summarize_weather(records)
+        for geo_key, records in weather_df.groupby('geo_key', sort=False, observed=True)
+    }
+    if not weather_df.empty else {}
+)
+
+# Simulated field values, drawn once and served round-robin instead of calling random per request
+RANDOM_POOL_SIZE = 1 << 20
+SOIL_TYPES = ('Loamy', 'Clay', 'Sandy', 'Black')
+IRRIGATION_TYPES = ('Rainfed', 'Canal', 'Borewell', 'Drip')
+FORECASTS = ('Clear sky', 'Partly cloudy', 'Cloudy', 'Light rain expected')
+
+_rng = np.random.default_rng()
+SOWING_OFFSETS = _rng.integers(30, 121, size=RANDOM_POOL_SIZE, dtype=np.int16)
+SURVEY_NUMBERS = _rng.integers(100, 1000, size=RANDOM_POOL_SIZE, dtype=np.int16)
+SURVEY_SUBDIVISIONS = _rng.integers(1, 51, size=RANDOM_POOL_SIZE, dtype=np.int8)
+SOIL_CODES = _rng.integers(0, len(SOIL_TYPES), size=RANDOM_POOL_SIZE, dtype=np.int8)
+IRRIGATION_CODES = _rng.integers(0, len(IRRIGATION_TYPES), size=RANDOM_POOL_SIZE, dtype=np.int8)
+FORECAST_CODES = _rng.integers(0, len(FORECASTS), size=RANDOM_POOL_SIZE, dtype=np.int8)
+
+_draws = itertools.count()
+
+def next_draw() -> int:
+    """Index of the next pre-drawn value (next() on a count is atomic under the GIL)"""
+    return next(_draws) & (RANDOM_POOL_SIZE - 1)
+
+# Response shapes: endpoints build these as plain dicts and hand them straight
+# to orjson, skipping response_model validation and jsonable_encoder
+class LandParcel(TypedDict):
     land_id: str
     area: float
     crop_type: str
     sowing_date: Optional[str]
     survey_number: str
 
-class FarmerData(BaseModel):
+class FarmerData(TypedDict):
     farmer_id: str
     name: str
     mobile: str
@@ -58,7 +155,7 @@ class FarmerData(BaseModel):
     village: str
     land_parcels: List[LandParcel]
 
-class LandDetails(BaseModel):
+class LandDetails(TypedDict):
     land_id: str
     area: float
     crop_type: str
@@ -66,16 +163,16 @@ class LandDetails(BaseModel):
     irrigation_type: str
     ownership_type: str
 
-class NDVIReading(BaseModel):
+class NDVIReading(TypedDict):
     date: str
     ndvi: float
     cloud_cover: float
 
-class SatelliteData(BaseModel):
+class SatelliteData(TypedDict):
     land_id: str
     readings: List[NDVIReading]
 
-class WeatherData(BaseModel):
+class WeatherData(TypedDict):
     geo_key: str
     latitude: float
     longitude: float
@@ -98,8 +195,8 @@ def root():
         ]
     }
 
-@app.get("/mock/farmer/{farmer_id}", response_model=FarmerData)
-def get_farmer(farmer_id: str):
+@app.get("/mock/farmer/{farmer_id}")
+def get_farmer(farmer_id: str) -> ORJSONResponse:
     """
     Get farmer data from mock Agri Stack
     
@@ -109,39 +206,38 @@ def get_farmer(farmer_id: str):
     Returns:
         Farmer data with land parcels
     """
-    if farmers_df.empty:
+    if not FARMERS:
         raise HTTPException(status_code=503, detail="Data not available")
     
-    farmer = farmers_df[farmers_df['farmer_id'] == farmer_id]
+    farmer = FARMERS.get(farmer_id)
     
-    if farmer.empty:
+    if farmer is None:
         raise HTTPException(status_code=404, detail=f"Farmer {farmer_id} not found")
     
-    farmer_row = farmer.iloc[0]
-    
     # Generate land parcel
+    draw = next_draw()
     land_id = f"LAND{farmer_id[3:]}"
     land_parcel = LandParcel(
         land_id=land_id,
-        area=farmer_row['land_area'],
-        crop_type=farmer_row['crop_type'],
-        sowing_date=(datetime.now() - timedelta(days=random.randint(30, 120))).strftime('%Y-%m-%d'),
-        survey_number=f"SY{random.randint(100, 999)}/{random.randint(1, 50)}"
+        area=farmer['land_area'],
+        crop_type=farmer['crop_type'],
+        sowing_date=(datetime.now() - timedelta(days=int(SOWING_OFFSETS[draw]))).strftime('%Y-%m-%d'),
+        survey_number=f"SY{SURVEY_NUMBERS[draw]}/{SURVEY_SUBDIVISIONS[draw]}"
     )
     
-    return FarmerData(
-        farmer_id=farmer_row['farmer_id'],
-        name=farmer_row['name'],
-        mobile=farmer_row['mobile'],
-        aadhar=farmer_row.get('aadhar'),
-        state=farmer_row['state'],
-        district=farmer_row['district'],
-        village=farmer_row['village'],
+    return ORJSONResponse(content=FarmerData(
+        farmer_id=farmer_id,
+        name=farmer['name'],
+        mobile=farmer['mobile'],
+        aadhar=farmer['aadhar'],
+        state=farmer['state'],
+        district=farmer['district'],
+        village=farmer['village'],
         land_parcels=[land_parcel]
-    )
+    ))
 
-@app.get("/mock/land/{land_id}", response_model=LandDetails)
-def get_land(land_id: str):
+@app.get("/mock/land/{land_id}")
+def get_land(land_id: str) -> ORJSONResponse:
     """
     Get land record details
     
@@ -151,29 +247,28 @@ def get_land(land_id: str):
     Returns:
         Land details
     """
-    if farmers_df.empty:
+    if not FARMERS:
         raise HTTPException(status_code=503, detail="Data not available")
     
     # Extract farmer ID from land ID
-    farmer_id = f"FRM{land_id[4:]}"
-    farmer = farmers_df[farmers_df['farmer_id'] == farmer_id]
+    farmer = FARMERS.get(f"FRM{land_id[4:]}")
     
-    if farmer.empty:
+    if farmer is None:
         raise HTTPException(status_code=404, detail=f"Land {land_id} not found")
     
-    farmer_row = farmer.iloc[0]
+    draw = next_draw()
     
-    return LandDetails(
+    return ORJSONResponse(content=LandDetails(
         land_id=land_id,
-        area=farmer_row['land_area'],
-        crop_type=farmer_row['crop_type'],
-        soil_type=random.choice(['Loamy', 'Clay', 'Sandy', 'Black']),
-        irrigation_type=random.choice(['Rainfed', 'Canal', 'Borewell', 'Drip']),
+        area=farmer['land_area'],
+        crop_type=farmer['crop_type'],
+        soil_type=SOIL_TYPES[SOIL_CODES[draw]],
+        irrigation_type=IRRIGATION_TYPES[IRRIGATION_CODES[draw]],
         ownership_type='Owned'
-    )
+    ))
 
-@app.get("/mock/satellite/{land_id}", response_model=SatelliteData)
-def get_satellite(land_id: str):
+@app.get("/mock/satellite/{land_id}")
+def get_satellite(land_id: str) -> Response:
     """
     Get satellite NDVI data for land parcel
     
@@ -183,30 +278,19 @@ def get_satellite(land_id: str):
     Returns:
         NDVI time series
     """
-    if satellite_df.empty:
+    if not SAT_CACHE:
         raise HTTPException(status_code=503, detail="Data not available")
     
-    # Get satellite data for this land
-    sat_data = satellite_df[satellite_df['land_id'] == land_id]
+    # Get pre-serialized satellite data for this land
+    sat_json = SAT_CACHE.get(land_id)
     
-    if sat_data.empty:
+    if sat_json is None:
         raise HTTPException(status_code=404, detail=f"No satellite data for {land_id}")
     
-    readings = []
-    for _, row in sat_data.iterrows():
-        readings.append(NDVIReading(
-            date=row['date'],
-            ndvi=row['ndvi'],
-            cloud_cover=row['cloud_cover']
-        ))
-    
-    return SatelliteData(
-        land_id=land_id,
-        readings=readings
-    )
+    return Response(content=sat_json, media_type="application/json")
 
-@app.get("/mock/weather/{geo}", response_model=WeatherData)
-def get_weather(geo: str):
+@app.get("/mock/weather/{geo}")
+def get_weather(geo: str) -> ORJSONResponse:
     """
     Get weather data for location
     
@@ -216,15 +300,15 @@ def get_weather(geo: str):
     Returns:
         Weather data
     """
-    if weather_df.empty:
+    if not WEATHER_SUMMARIES:
         raise HTTPException(status_code=503, detail="Data not available")
     
     # Try to find matching geo key
-    weather = weather_df[weather_df['geo_key'] == geo]
+    weather = WEATHER_SUMMARIES.get(geo)
     
-    if weather.empty:
+    if weather is None:
         # Return default data
-        return WeatherData(
+        return ORJSONResponse(content=WeatherData(
             geo_key=geo,
             latitude=25.0,
             longitude=75.0,
@@ -232,20 +316,19 @@ def get_weather(geo: str):
             avg_temperature=30.0,
             humidity=65.0,
             forecast="Partly cloudy"
-        )
+        ))
     
-    # Get recent data
-    recent = weather.tail(7)
+    latitude, longitude, rainfall_mm, avg_temperature, humidity = weather
     
-    return WeatherData(
+    return ORJSONResponse(content=WeatherData(
         geo_key=geo,
-        latitude=recent.iloc[0]['latitude'],
-        longitude=recent.iloc[0]['longitude'],
-        recent_rainfall_mm=round(recent['rainfall_mm'].sum(), 1),
-        avg_temperature=round(recent['temperature_max'].mean(), 1),
-        humidity=round(recent['humidity'].mean(), 1),
-        forecast=random.choice(['Clear sky', 'Partly cloudy', 'Cloudy', 'Light rain expected'])
-    )
+        latitude=latitude,
+        longitude=longitude,
+        recent_rainfall_mm=rainfall_mm,
+        avg_temperature=avg_temperature,
+        humidity=humidity,
+        forecast=FORECASTS[FORECAST_CODES[next_draw()]]
+    ))
 
 @app.get("/healthz")
 def health():
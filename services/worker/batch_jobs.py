@@ -0,0 +1,170 @@
+"""
+Batch scoring jobs, run by the worker against the API's database tables
+
+The tables are reflected from the database (the API owns their definitions),
+so the worker needs only the DB_* and REDIS_URL settings, not the API code.
+"""
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import logging
+import os
+import numpy as np
+import redis
+from sqlalchemy import Engine, MetaData, Table, create_engine, insert, select, update
+
+from scoring_service import (
+    build_farmer_data,
+    get_score_bands,
+    score_farmers,
+    score_farmers_parallel
+)
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+# Recycle connections before server-side idle timeouts
+POOL_RECYCLE_SECONDS = 3600
+
+# Keep Redis outages from failing jobs; cached profiles then expire on their TTL
+REDIS_SOCKET_TIMEOUT = 0.25
+
+redis_client = redis.Redis.from_url(
+    REDIS_URL,
+    decode_responses=True,
+    socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+    socket_timeout=REDIS_SOCKET_TIMEOUT
+)
+
+def database_url() -> str:
+    """Postgres URL from the same DB_* variables the API reads"""
+    return "postgresql://{}:{}@{}:{}/{}".format(
+        os.getenv('DB_USER', 'postgres'),
+        os.getenv('DB_PASS', 'postgres'),
+        os.getenv('DB_HOST', 'localhost'),
+        os.getenv('DB_PORT', '5432'),
+        os.getenv('DB_NAME', 'fcs')
+    )
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Database engine, created once per worker process"""
+    # Workers can sit idle between tasks, so connections are pinged on checkout
+    return create_engine(database_url(), pool_pre_ping=True, pool_recycle=POOL_RECYCLE_SECONDS)
+
+@lru_cache(maxsize=None)
+def get_tables(engine: Engine) -> Tuple[Table, Table, Table]:
+    """Reflect the farmers, scores and jobs tables once per engine"""
+    metadata = MetaData()
+    metadata.reflect(bind=engine, only=['farmers', 'scores', 'jobs'])
+    return metadata.tables['farmers'], metadata.tables['scores'], metadata.tables['jobs']
+
+def invalidate_farmers(farmer_ids: List[str]) -> None:
+    """Drop the API's cached profiles (keys from cache.farmer_cache_key) with one round-trip"""
+    if not farmer_ids:
+        return
+    
+    try:
+        redis_client.delete(*(f"farmer:{farmer_id}" for farmer_id in farmer_ids))
+    except redis.RedisError as e:
+        logger.warning(f"Farmer cache invalidation failed: {e}")
+
+def run_batch_score(engine: Engine, job_id: str, pool=None, workers: int = 1) -> Optional[dict]:
+    """
+    Score the farmers listed on a batch_score job and record the outcome
+    
+    Loads all farmers in one query, scores them with a single model call (or
+    one call per chunk when given a process pool) and writes the scores in
+    bulk. The job is marked completed with the farmer IDs that were scored,
+    lacked consent, or were not found.
+    
+    Args:
+        engine: Database engine
+        job_id: ID of the pending batch_score job
+        pool: Optional pool from scoring_service.create_scoring_pool
+        workers: Number of processes in pool
+    
+    Returns:
+        Totals for the job, or None if the job does not exist
+    """
+    farmers, scores, jobs = get_tables(engine)
+    
+    with engine.begin() as conn:
+        job = conn.execute(
+            select(jobs.c.id, jobs.c.input_data, jobs.c.created_by).where(jobs.c.job_id == job_id)
+        ).first()
+        if job is None:
+            return None
+        conn.execute(
+            update(jobs).where(jobs.c.id == job.id).values(status="running", started_at=datetime.utcnow())
+        )
+    
+    farmer_ids = job.input_data["farmer_ids"]
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(
+                farmers.c.id,
+                farmers.c.farmer_id,
+                farmers.c.consent_given,
+                farmers.c.land_area,
+                farmers.c.crop_type
+            ).where(farmers.c.farmer_id.in_(farmer_ids))
+        ).all()
+    scorable = [row for row in rows if row.consent_given]
+    farmer_data_list = [build_farmer_data(row) for row in scorable]
+    
+    # Score all farmers using ML model or deterministic fallback
+    if pool is not None and workers > 1:
+        results, model_type = score_farmers_parallel(pool, farmer_data_list, workers)
+    else:
+        results, model_type = score_farmers(farmer_data_list)
+    
+    score_bands = get_score_bands(
+        np.array([score_value for score_value, _ in results], dtype=np.float64)
+    )
+    
+    found_ids = {row.farmer_id for row in rows}
+    output_data = {
+        "scored": [row.farmer_id for row in scorable],
+        "no_consent": [row.farmer_id for row in rows if not row.consent_given],
+        "not_found": [farmer_id for farmer_id in farmer_ids if farmer_id not in found_ids]
+    }
+    
+    with engine.begin() as conn:
+        if scorable:
+            conn.execute(insert(scores), [
+                {
+                    "farmer_id": row.id,
+                    "score": score_value,
+                    "score_band": score_band,
+                    "features": farmer_data,
+                    "drivers": drivers_data,
+                    "model_version": "1.0",
+                    "model_type": model_type,
+                    "computed_by": job.created_by
+                }
+                for row, farmer_data, (score_value, drivers_data), score_band in zip(
+                    scorable, farmer_data_list, results, score_bands
+                )
+            ])
+        conn.execute(
+            update(jobs).where(jobs.c.id == job.id).values(
+                status="completed",
+                progress=100,
+                output_data=output_data,
+                completed_at=datetime.utcnow()
+            )
+        )
+    
+    invalidate_farmers(output_data["scored"])
+    
+    return {"total": len(farmer_ids), "completed": len(scorable)}
+
+def mark_job_failed(engine: Engine, job_id: str, error_message: str) -> None:
+    """Record a batch_score job as failed"""
+    _, _, jobs = get_tables(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            update(jobs).where(jobs.c.job_id == job_id).values(status="failed", error_message=error_message)
+        )
@@ -2,15 +2,17 @@
 Worker Service for background tasks
 """
 from celery import Celery
+from functools import lru_cache
 import os
-import sys
 
-# Add ML module to path
-ml_path = os.path.join(os.path.dirname(__file__), '../ml')
-sys.path.insert(0, ml_path)
+# The ML modules (model and shared scoring code) are imported from PYTHONPATH;
+# see the worker service in docker-compose.yml
 
 # Configuration
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+BATCH_SCORE_QUEUE = os.getenv('BATCH_SCORE_QUEUE', 'scoring')
+SCORE_CACHE_SIZE = int(os.getenv('SCORE_CACHE_SIZE', '100000'))
+BATCH_SCORE_PROCESSES = int(os.getenv('BATCH_SCORE_PROCESSES', str(os.cpu_count() or 1)))
 
 # Create Celery app
 app = Celery('fcs_worker', broker=REDIS_URL, backend=REDIS_URL)
@@ -22,8 +24,43 @@ app.conf.update(
     result_serializer='json',
     timezone='UTC',
     enable_utc=True,
+    task_routes={'batch_score_task': {'queue': BATCH_SCORE_QUEUE}},
 )
 
+def quantize_farmer_data(farmer_data: dict) -> tuple:
+    """
+    Hashable cache key for farmer inputs
+    
+    Floats are rounded to 3 decimals so near-identical inputs share an entry;
+    other values are kept as-is.
+    """
+    return tuple(sorted(
+        (key, round(value, 3) if isinstance(value, float) else value)
+        for key, value in farmer_data.items()
+    ))
+
+@lru_cache(maxsize=SCORE_CACHE_SIZE)
+def _cached_score(farmer_key: tuple) -> tuple:
+    """Score quantized farmer inputs once per worker process"""
+    from scoring_service import score_farmer
+    score, drivers, _ = score_farmer(dict(farmer_key))
+    return score, drivers
+
+def cached_predict(farmer_key: tuple) -> tuple:
+    """
+    Cached score and drivers for quantized farmer inputs
+    
+    Drivers are copied so callers cannot mutate the cached entry.
+    """
+    score, drivers = _cached_score(farmer_key)
+    return score, [dict(driver) for driver in drivers]
+
+@lru_cache(maxsize=1)
+def get_batch_pool():
+    """Process pool for batch scoring, created once per worker process"""
+    from scoring_service import create_scoring_pool
+    return create_scoring_pool(BATCH_SCORE_PROCESSES)
+
 @app.task(name='compute_score_task')
 def compute_score_task(farmer_data: dict) -> dict:
     """
@@ -36,9 +73,7 @@ def compute_score_task(farmer_data: dict) -> dict:
         Score and drivers
     """
     try:
-        from model import get_model
-        model = get_model()
-        score, drivers = model.predict(farmer_data)
+        score, drivers = cached_predict(quantize_farmer_data(farmer_data))
         
         return {
             'success': True,
@@ -52,32 +87,41 @@ def compute_score_task(farmer_data: dict) -> dict:
         }
 
 @app.task(name='batch_score_task')
-def batch_score_task(farmer_ids: list) -> dict:
+def batch_score_task(job_id: str) -> dict:
     """
     Background task for batch scoring
     
     Args:
-        farmer_ids: List of farmer IDs to score
+        job_id: ID of the pending batch_score Job created by the API
     
     Returns:
         Batch results
     """
-    results = []
+    from batch_jobs import get_engine, mark_job_failed, run_batch_score
     
-    for farmer_id in farmer_ids:
-        # In production, fetch farmer data from database
-        # For now, return placeholder
-        results.append({
-            'farmer_id': farmer_id,
-            'status': 'completed'
-        })
-    
-    return {
-        'success': True,
-        'total': len(farmer_ids),
-        'completed': len(results),
-        'results': results
-    }
+    engine = get_engine()
+    try:
+        if BATCH_SCORE_PROCESSES > 1:
+            totals = run_batch_score(engine, job_id, pool=get_batch_pool(), workers=BATCH_SCORE_PROCESSES)
+        else:
+            totals = run_batch_score(engine, job_id)
+        
+        if totals is None:
+            return {
+                'success': False,
+                'error': f"Job {job_id} not found"
+            }
+        
+        return {
+            'success': True,
+            **totals
+        }
+    except Exception as e:
+        mark_job_failed(engine, job_id, str(e))
+        return {
+            'success': False,
+            'error': str(e)
+        }
 
 @app.task(name='ingest_satellite_data')
 def ingest_satellite_data() -> dict: